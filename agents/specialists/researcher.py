@@ -6,6 +6,7 @@ Investigates emerging technologies, evaluates tools/frameworks,
 conducts feasibility studies, and proposes technical improvements.
 """
 
+import os
 import sys
 sys.path.insert(0, '/root/payverse/agents')
 
@@ -26,33 +27,63 @@ class ResearcherAgent(BaseAgent):
     - Competitive analysis
     """
 
+    # Shared by every instance; each agent gets its own list copy
+    _CAPABILITIES: tuple[AgentCapability, ...] = (
+        AgentCapability("technology_research", "Research emerging technologies"),
+        AgentCapability("framework_evaluation", "Evaluate frameworks and libraries"),
+        AgentCapability("feasibility_study", "Conduct feasibility studies"),
+        AgentCapability("best_practices", "Research best practices"),
+        AgentCapability("security_research", "Research security vulnerabilities"),
+        AgentCapability("performance_analysis", "Analyze performance patterns"),
+        AgentCapability("dependency_audit", "Audit project dependencies"),
+        AgentCapability("code_analysis", "Analyze codebase patterns"),
+    )
+
     def __init__(self):
         super().__init__(name="Sage", role=AgentRole.RESEARCHER)
+        # The knowledge base is static for the life of the process, so
+        # query results and the package.json parse can be reused
+        self._knowledge_cache: dict[str, tuple[dict, ...]] = {}
+        self._dependency_cache: tuple[float, dict] | None = None
 
     def _register_capabilities(self):
-        self.capabilities = [
-            AgentCapability("technology_research", "Research emerging technologies"),
-            AgentCapability("framework_evaluation", "Evaluate frameworks and libraries"),
-            AgentCapability("feasibility_study", "Conduct feasibility studies"),
-            AgentCapability("best_practices", "Research best practices"),
-            AgentCapability("security_research", "Research security vulnerabilities"),
-            AgentCapability("performance_analysis", "Analyze performance patterns"),
-            AgentCapability("dependency_audit", "Audit project dependencies"),
-            AgentCapability("code_analysis", "Analyze codebase patterns"),
-        ]
+        self.capabilities = list(self._CAPABILITIES)
+
+    def query_knowledge(self, query: str) -> list[dict]:
+        """Query the knowledge base, memoized per query string."""
+        results = self._knowledge_cache.get(query)
+        if results is None:
+            results = self._knowledge_cache[query] = tuple(super().query_knowledge(query))
+        # A fresh list per call, so callers that mutate it never touch the cache
+        return list(results)
+
+    def get_dependencies(self) -> dict:
+        """Get project dependencies, re-reading package.json only when it changes."""
+        try:
+            mtime = os.path.getmtime(f"{self.kb.project.root_path}/package.json")
+        except OSError:
+            return super().get_dependencies()
+
+        if self._dependency_cache is None or self._dependency_cache[0] != mtime:
+            self._dependency_cache = (mtime, super().get_dependencies())
+        # Fresh dicts per call, so callers that mutate them never touch the cache
+        return {
+            key: value.copy() if isinstance(value, dict) else value
+            for key, value in self._dependency_cache[1].items()
+        }
 
     def analyze(self, request: str) -> dict:
         """Analyze research request."""
+        request_lower = request.lower()
+
         analysis = {
             "request": request,
-            "research_type": self._identify_research_type(request),
+            "research_type": self._identify_research_type_from_lower(request_lower),
             "scope": "",
             "methodology": [],
             "expected_outputs": [],
         }
 
-        request_lower = request.lower()
-
         if "security" in request_lower:
             analysis["scope"] = "security"
             analysis["methodology"] = ["vulnerability scan", "dependency audit", "code review"]
@@ -67,7 +98,10 @@ class ResearcherAgent(BaseAgent):
 
     def _identify_research_type(self, request: str) -> str:
         """Identify type of research needed."""
-        request_lower = request.lower()
+        return self._identify_research_type_from_lower(request.lower())
+
+    def _identify_research_type_from_lower(self, request_lower: str) -> str:
+        """Identify type of research needed from an already-lowercased request."""
         if any(word in request_lower for word in ["security", "vulnerability", "audit"]):
             return "security_research"
         elif any(word in request_lower for word in ["performance", "speed", "optimize"]):
@@ -83,16 +117,17 @@ class ResearcherAgent(BaseAgent):
         self.start_task(task)
 
         try:
-            research_type = self._identify_research_type(task.description)
+            description_lower = task.description.lower()
+            research_type = self._identify_research_type_from_lower(description_lower)
 
             if research_type == "security_research":
                 result = self.security_research(task.description)
             elif research_type == "performance_research":
                 result = self.performance_research()
             elif research_type == "technology_evaluation":
-                result = self.evaluate_technology(task.description)
+                result = self.evaluate_technology(task.description, description_lower)
             elif research_type == "best_practices":
-                result = self.research_best_practices(task.description)
+                result = self.research_best_practices(task.description, description_lower)
             else:
                 result = self.general_research(task.description)
 
@@ -202,7 +237,7 @@ class ResearcherAgent(BaseAgent):
 
         return research
 
-    def evaluate_technology(self, description: str) -> dict:
+    def evaluate_technology(self, description: str, description_lower: str | None = None) -> dict:
         """Evaluate a technology for potential use."""
         evaluation = {
             "description": description,
@@ -230,7 +265,8 @@ class ResearcherAgent(BaseAgent):
             "Security track record",
         ]
 
-        description_lower = description.lower()
+        if description_lower is None:
+            description_lower = description.lower()
 
         # Provide relevant alternatives based on topic
         if "database" in description_lower:
@@ -254,7 +290,7 @@ class ResearcherAgent(BaseAgent):
 
         return evaluation
 
-    def research_best_practices(self, topic: str) -> dict:
+    def research_best_practices(self, topic: str, topic_lower: str | None = None) -> dict:
         """Research best practices for a topic."""
         research = {
             "topic": topic,
@@ -264,7 +300,8 @@ class ResearcherAgent(BaseAgent):
             "recommendations": [],
         }
 
-        topic_lower = topic.lower()
+        if topic_lower is None:
+            topic_lower = topic.lower()
 
         if "api" in topic_lower:
             research["industry_best_practices"] = [
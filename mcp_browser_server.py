@@ -3,41 +3,77 @@
 
 import asyncio
 import base64
-from typing import Any
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent, ImageContent
 
-from playwright.async_api import async_playwright, Browser, Page
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page
 
-# Global browser instance
-playwright_instance = None
-browser: Browser | None = None
-page: Page | None = None
+
+@dataclass(slots=True)
+class BrowserSession:
+    """Playwright handles and background tasks for one browser."""
+    playwright: Any = None
+    browser: "Browser | None" = None
+    page: "Page | None" = None
+    # Serializes browser startup so the warm-up task and the first tool call
+    # never launch two Chromium instances
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Pending background teardown started by browser_close
+    close_task: asyncio.Task | None = None
+
+
+_session = BrowserSession()
+
+# Sets an input's value in a single evaluate call. Goes through the native
+# value setter so framework-controlled inputs (React) see the change.
+_FAST_FILL_JS = """(el, text) => {
+    el.focus();
+    const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), "value").set;
+    setter.call(el, text);
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+}"""
 
 app = Server("browser-use-mcp")
 
 
-async def get_browser() -> Browser:
+async def get_browser(session: BrowserSession) -> "Browser":
     """Get or create a browser instance."""
-    global playwright_instance, browser
-    if browser is None:
-        playwright_instance = await async_playwright().start()
-        browser = await playwright_instance.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-setuid-sandbox']
-        )
-    return browser
+    async with session.lock:
+        if session.browser is None:
+            # Imported lazily to keep module import and server startup fast
+            from playwright.async_api import async_playwright
+            session.playwright = await async_playwright().start()
+            session.browser = await session.playwright.chromium.launch(
+                headless=True,
+                args=['--no-sandbox', '--disable-setuid-sandbox']
+            )
+    return session.browser
 
 
-async def get_page() -> Page:
+async def warm_up_browser(session: BrowserSession):
+    """Launch Chromium ahead of the first tool call."""
+    try:
+        # Import Playwright off the event loop so stdio can start serving
+        await asyncio.to_thread(import_module, "playwright.async_api")
+        await get_browser(session)
+    except Exception:
+        # The first tool call will retry the launch and report the error
+        pass
+
+
+async def get_page(session: BrowserSession) -> "Page":
     """Get or create a page instance."""
-    global page
-    if page is None:
-        b = await get_browser()
-        page = await b.new_page()
-    return page
+    if session.page is None:
+        b = await get_browser(session)
+        session.page = await b.new_page()
+    return session.page
 
 
 @app.list_tools()
@@ -82,6 +118,7 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "selector": {"type": "string", "description": "CSS selector of input field"},
                     "text": {"type": "string", "description": "Text to type"},
+                    "fast": {"type": "boolean", "description": "Set the value in one DOM update instead of filling (default false)"},
                 },
                 "required": ["selector", "text"],
             },
@@ -138,18 +175,25 @@ async def list_tools() -> list[Tool]:
 
 @app.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
-    """Handle tool calls."""
-    global browser, page, playwright_instance
+    """Handle tool calls.
 
-    try:
-        if name == "browser_navigate":
-            p = await get_page()
+    Failures propagate as exceptions; the MCP server turns them into a
+    CallToolResult with isError set, so clients never have to scan text.
+    """
+    return await run_tool(_session, name, arguments)
+
+
+async def run_tool(session: BrowserSession, name: str, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
+    """Run one browser tool against the given session."""
+    match name:
+        case "browser_navigate":
+            p = await get_page(session)
             await p.goto(arguments["url"], wait_until="domcontentloaded")
             title = await p.title()
             return [TextContent(type="text", text=f"Navigated to {arguments['url']} - Title: {title}")]
 
-        elif name == "browser_screenshot":
-            p = await get_page()
+        case "browser_screenshot":
+            p = await get_page(session)
             screenshot = await p.screenshot()
             screenshot_b64 = base64.b64encode(screenshot).decode("utf-8")
             return [
@@ -157,8 +201,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent |
                 TextContent(type="text", text="Screenshot captured"),
             ]
 
-        elif name == "browser_click":
-            p = await get_page()
+        case "browser_click":
+            p = await get_page(session)
             selector = arguments["selector"]
             try:
                 await p.click(selector, timeout=5000)
@@ -167,23 +211,27 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent |
                 await p.get_by_text(selector).click(timeout=5000)
             return [TextContent(type="text", text=f"Clicked on {selector}")]
 
-        elif name == "browser_type":
-            p = await get_page()
-            await p.fill(arguments["selector"], arguments["text"])
+        case "browser_type":
+            p = await get_page(session)
+            if arguments.get("fast"):
+                # One round-trip; locator keeps Playwright's auto-waiting
+                await p.locator(arguments["selector"]).evaluate(_FAST_FILL_JS, arguments["text"])
+            else:
+                await p.fill(arguments["selector"], arguments["text"])
             return [TextContent(type="text", text=f"Typed text into {arguments['selector']}")]
 
-        elif name == "browser_get_content":
-            p = await get_page()
+        case "browser_get_content":
+            p = await get_page(session)
             text = await p.evaluate("() => document.body.innerText")
             return [TextContent(type="text", text=text[:10000])]  # Limit to 10k chars
 
-        elif name == "browser_get_html":
-            p = await get_page()
+        case "browser_get_html":
+            p = await get_page(session)
             html = await p.content()
             return [TextContent(type="text", text=html[:20000])]  # Limit to 20k chars
 
-        elif name == "browser_scroll":
-            p = await get_page()
+        case "browser_scroll":
+            p = await get_page(session)
             direction = arguments["direction"]
             amount = arguments.get("amount", 500)
             if direction == "down":
@@ -192,40 +240,69 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent |
                 await p.evaluate(f"window.scrollBy(0, -{amount})")
             return [TextContent(type="text", text=f"Scrolled {direction} by {amount}px")]
 
-        elif name == "browser_wait":
-            p = await get_page()
+        case "browser_wait":
+            p = await get_page(session)
             selector = arguments.get("selector")
             timeout = arguments.get("timeout", 1000)
             if selector:
-                await p.wait_for_selector(selector, timeout=timeout)
+                await p.wait_for_selector(selector, state="visible", timeout=timeout)
                 return [TextContent(type="text", text=f"Element {selector} found")]
             else:
                 await asyncio.sleep(timeout / 1000)
                 return [TextContent(type="text", text=f"Waited {timeout}ms")]
 
-        elif name == "browser_close":
-            if page:
-                await page.close()
-                page = None
-            if browser:
-                await browser.close()
-                browser = None
-            if playwright_instance:
-                await playwright_instance.stop()
-                playwright_instance = None
-            return [TextContent(type="text", text="Browser closed")]
+        case "browser_close":
+            closers = _detach_closers(session)
+            if closers:
+                # Tear down in the background so the tool returns immediately
+                session.close_task = asyncio.create_task(_close_sequentially(closers))
+            return [TextContent(type="text", text="Browser closing")]
+
+        case _:
+            raise ValueError(f"Unknown tool: {name}")
 
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
-    except Exception as e:
-        return [TextContent(type="text", text=f"Error: {str(e)}")]
+def _detach_closers(session: BrowserSession) -> list:
+    """Detach the session's page, browser and Playwright, returning their closers.
+
+    Any teardown already in flight goes first so closes never overlap.
+    """
+    closers = []
+    if session.close_task is not None:
+        closers.append(session.close_task)
+        session.close_task = None
+    if session.page:
+        closers.append(session.page.close())
+        session.page = None
+    if session.browser:
+        closers.append(session.browser.close())
+        session.browser = None
+    if session.playwright:
+        closers.append(session.playwright.stop())
+        session.playwright = None
+    return closers
+
+
+async def _close_sequentially(closers: list):
+    """Run page, browser and Playwright teardown in order, ignoring errors."""
+    for closer in closers:
+        try:
+            await closer
+        except Exception:
+            pass
 
 
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    warm_up = asyncio.create_task(warm_up_browser(_session))
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        # Shutdown barrier: let background startup finish, then close whatever
+        # is still open behind any teardown already in flight
+        await warm_up
+        await _close_sequentially(_detach_closers(_session))
 
 
 if __name__ == "__main__":
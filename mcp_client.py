@@ -2,7 +2,6 @@
 """MCP Client for Browser Use - Connects to the browser MCP server."""
 
 import asyncio
-import json
 import sys
 from contextlib import asynccontextmanager
 
@@ -15,12 +15,24 @@ Usage:
 import argparse
 import sys
 import json
+from itertools import islice
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent / "agents"))
+try:
+    import orjson
 
-from core.orchestrator import get_orchestrator
-from knowledge.payverse_kb import get_knowledge_base
+    def _dumps(obj, pretty: bool = False) -> str:
+        """Serialize an agent response for display (compact unless pretty)."""
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str).decode()
+except ImportError:
+    def _dumps(obj, pretty: bool = False) -> str:
+        """Serialize an agent response for display (compact unless pretty)."""
+        if pretty:
+            return json.dumps(obj, indent=2, default=str)
+        return json.dumps(obj, default=str, separators=(",", ":"))
 
 
 BANNER = """
@@ -38,6 +50,10 @@ BANNER = """
 ╚══════════════════════════════════════════════════════════════════════╝\033[0m
 """
 
+PROMPT = "\033[92mpayverse>\033[0m "
+
+QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
 
 def print_banner():
     """Print the Payverse team banner."""
@@ -49,66 +65,68 @@ def show_team_roster(orchestrator):
     print(orchestrator.generate_summary())
 
 
-def show_status(orchestrator):
+def show_status(orchestrator, kb):
     """Display project and team status."""
     status = orchestrator.quick_status()
-    kb = get_knowledge_base()
 
-    print("\n" + "=" * 60)
-    print("  PAYVERSE PROJECT STATUS")
-    print("=" * 60)
-    print(f"\n  Orchestrator: {status['orchestrator']}")
-    print(f"  Agents Online: {status['agents_online']}")
-    print(f"  Requests Processed: {status['requests_processed']}")
-    print("\n  Team Members:")
-    for agent in status['agents']:
-        print(f"    - {agent['name']} ({agent['role']})")
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("  PAYVERSE PROJECT STATUS")
+    out.append("=" * 60)
+    out.append(f"\n  Orchestrator: {status['orchestrator']}")
+    out.append(f"  Agents Online: {status['agents_online']}")
+    out.append(f"  Requests Processed: {status['requests_processed']}")
+    out.append("\n  Team Members:")
+    out.extend(f"    - {a['name']} ({a['role']})" for a in status['agents'])
 
-    print("\n" + "-" * 60)
-    print("  PROJECT INFO")
-    print("-" * 60)
-    print(kb.get_summary())
-    print("=" * 60)
+    out.append("\n" + "-" * 60)
+    out.append("  PROJECT INFO")
+    out.append("-" * 60)
+    out.append(kb.get_summary())
+    out.append("=" * 60)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def process_request(orchestrator, request: str, execute: bool = False):
     """Process a request through the team."""
     response = orchestrator.process_request(request, execute=execute)
 
-    print("\n" + "=" * 60)
-    print("  TEAM RESPONSE")
-    print("=" * 60)
-    print(f"\n  Request: {response.request}")
-    print(f"  Category: {response.category.value}")
-    print(f"  Status: {response.status}")
-    print(f"\n  Assigned Agents: {', '.join(response.assigned_agents)}")
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("  TEAM RESPONSE")
+    out.append("=" * 60)
+    out.append(f"\n  Request: {response.request}")
+    out.append(f"  Category: {response.category.value}")
+    out.append(f"  Status: {response.status}")
+    out.append(f"\n  Assigned Agents: {', '.join(response.assigned_agents)}")
 
-    print("\n  Analysis:")
+    out.append("\n  Analysis:")
     for agent_name, analysis in response.analysis.items():
-        print(f"\n    >> {agent_name}:")
+        out.append(f"\n    >> {agent_name}:")
         if isinstance(analysis, dict):
-            for key, value in list(analysis.items())[:5]:
+            for key, value in islice(analysis.items(), 5):
                 if isinstance(value, list):
-                    print(f"       {key}: {len(value)} items")
+                    out.append(f"       {key}: {len(value)} items")
                 elif isinstance(value, dict):
-                    print(f"       {key}: {{...}}")
+                    out.append(f"       {key}: {{...}}")
                 else:
-                    print(f"       {key}: {str(value)[:50]}")
+                    out.append(f"       {key}: {str(value)[:50]}")
 
-    print("\n  Execution Plan:")
+    out.append("\n  Execution Plan:")
     for step in response.plan:
-        print(f"    {step['step']}. {step['action']} ({step['agent']})")
+        out.append(f"    {step['step']}. {step['action']} ({step['agent']})")
 
     if response.execution_results:
-        print("\n  Execution Results:")
+        out.append("\n  Execution Results:")
         for result in response.execution_results:
             status_icon = "✓" if result['status'] == 'success' else "✗"
-            print(f"    {status_icon} Step {result['step']}: {result['action']} - {result['status']}")
+            out.append(f"    {status_icon} Step {result['step']}: {result['action']} - {result['status']}")
 
-    print("\n" + "=" * 60)
+    out.append("\n" + "=" * 60)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def consult_agent(orchestrator, agent_name: str, query: str = None):
+def consult_agent(orchestrator, agent_name: str, query: str = None, pretty: bool = False):
     """Consult a specific agent."""
     agent = orchestrator.get_agent(agent_name)
 
@@ -124,33 +142,10 @@ def consult_agent(orchestrator, agent_name: str, query: str = None):
         print(f"\n  Query: {query}")
         result = agent.analyze(query)
         print("\n  Response:")
-        print(json.dumps(result, indent=2, default=str))
-
-
-def interactive_mode(orchestrator):
-    """Run interactive mode."""
-    print_banner()
-    show_team_roster(orchestrator)
-
-    print("\n\033[96mInteractive Mode - Type 'help' for commands, 'quit' to exit\033[0m\n")
-
-    while True:
-        try:
-            user_input = input("\033[92mpayverse>\033[0m ").strip()
-
-            if not user_input:
-                continue
-
-            parts = user_input.split(maxsplit=1)
-            command = parts[0].lower()
-            args = parts[1] if len(parts) > 1 else ""
+        print(_dumps(result, pretty=pretty))
 
-            if command in ("quit", "exit", "q"):
-                print("\n  Goodbye! The team is always here when you need us.\n")
-                break
 
-            elif command == "help":
-                print("""
+HELP_TEXT = """
   Available Commands:
   -------------------
   team              - Show team roster and capabilities
@@ -164,61 +159,124 @@ def interactive_mode(orchestrator):
   apis              - Show API endpoints
   help              - Show this help message
   quit              - Exit interactive mode
-                """)
+                """
 
-            elif command == "team":
-                show_team_roster(orchestrator)
 
-            elif command == "status":
-                show_status(orchestrator)
+# ========== Interactive Command Handlers ==========
+# Each handler takes (orchestrator, kb, args) and validates its own args.
 
-            elif command == "ask" and args:
-                process_request(orchestrator, args, execute=False)
+def _cmd_help(orchestrator, kb, args: str):
+    print(HELP_TEXT)
 
-            elif command == "run" and args:
-                process_request(orchestrator, args, execute=True)
 
-            elif command == "consult":
-                if args:
-                    agent_parts = args.split(maxsplit=1)
-                    agent_name = agent_parts[0]
-                    query = agent_parts[1] if len(agent_parts) > 1 else None
-                    consult_agent(orchestrator, agent_name, query)
-                else:
-                    print("  Usage: consult <agent_name> [query]")
-                    print(f"  Available agents: {', '.join(orchestrator.agents.keys())}")
-
-            elif command == "agents":
-                print("\n  Available Agents:")
-                for name, agent in orchestrator.agents.items():
-                    print(f"    - {name}: {agent.name} ({agent.role.value})")
-
-            elif command == "search" and args:
-                kb = get_knowledge_base()
-                results = kb.search_knowledge(args)
-                print(f"\n  Search results for '{args}':")
-                for result in results[:10]:
-                    print(f"    - [{result['type']}] {result['name']}")
-
-            elif command == "files":
-                kb = get_knowledge_base()
-                print("\n  Key Project Files:")
-                for name, desc in list(kb.project.key_files.items())[:15]:
-                    print(f"    - {name}: {desc}")
-
-            elif command == "apis":
-                kb = get_knowledge_base()
-                print("\n  API Categories:")
-                for category in ["auth", "wallet", "crypto", "casino", "admin"]:
-                    endpoints = kb.get_endpoint_info(category)
-                    print(f"\n    {category.upper()}:")
-                    for endpoint, desc in list(endpoints.items())[:5]:
-                        print(f"      {endpoint}")
+def _cmd_team(orchestrator, kb, args: str):
+    show_team_roster(orchestrator)
 
+
+def _cmd_status(orchestrator, kb, args: str):
+    show_status(orchestrator, kb)
+
+
+def _cmd_ask(orchestrator, kb, args: str):
+    if not args:
+        print("  Usage: ask <request>")
+        return
+    process_request(orchestrator, args, execute=False)
+
+
+def _cmd_run(orchestrator, kb, args: str):
+    if not args:
+        print("  Usage: run <request>")
+        return
+    process_request(orchestrator, args, execute=True)
+
+
+def _cmd_consult(orchestrator, kb, args: str):
+    if not args:
+        print("  Usage: consult <agent_name> [query]")
+        print(f"  Available agents: {', '.join(orchestrator.agents.keys())}")
+        return
+    agent_parts = args.split(maxsplit=1)
+    agent_name = agent_parts[0]
+    query = agent_parts[1] if len(agent_parts) > 1 else None
+    consult_agent(orchestrator, agent_name, query)
+
+
+def _cmd_agents(orchestrator, kb, args: str):
+    print("\n  Available Agents:")
+    print("\n".join(
+        f"    - {name}: {agent.name} ({agent.role.value})"
+        for name, agent in orchestrator.agents.items()
+    ))
+
+
+def _cmd_search(orchestrator, kb, args: str):
+    if not args:
+        print("  Usage: search <query>")
+        return
+    results = kb.search_knowledge(args)
+    print(f"\n  Search results for '{args}':")
+    for result in results[:10]:
+        print(f"    - [{result['type']}] {result['name']}")
+
+
+def _cmd_files(orchestrator, kb, args: str):
+    print("\n  Key Project Files:")
+    for name, desc in islice(kb.project.key_files.items(), 15):
+        print(f"    - {name}: {desc}")
+
+
+def _cmd_apis(orchestrator, kb, args: str):
+    print("\n  API Categories:")
+    for category in ["auth", "wallet", "crypto", "casino", "admin"]:
+        endpoints = kb.get_endpoint_info(category)
+        print(f"\n    {category.upper()}:")
+        for endpoint in islice(endpoints, 5):
+            print(f"      {endpoint}")
+
+
+COMMANDS = {
+    "help": _cmd_help,
+    "team": _cmd_team,
+    "status": _cmd_status,
+    "ask": _cmd_ask,
+    "run": _cmd_run,
+    "consult": _cmd_consult,
+    "agents": _cmd_agents,
+    "search": _cmd_search,
+    "files": _cmd_files,
+    "apis": _cmd_apis,
+}
+
+
+def interactive_mode(orchestrator, kb, show_banner: bool = True):
+    """Run interactive mode."""
+    if show_banner:
+        print_banner()
+    show_team_roster(orchestrator)
+
+    print("\n\033[96mInteractive Mode - Type 'help' for commands, 'quit' to exit\033[0m\n")
+
+    while True:
+        try:
+            user_input = input(PROMPT).strip()
+
+            if not user_input:
+                continue
+
+            command, *rest = user_input.split(maxsplit=1)
+            command = command.lower()
+
+            if command in QUIT_COMMANDS:
+                print("\n  Goodbye! The team is always here when you need us.\n")
+                break
+
+            handler = COMMANDS.get(command)
+            if handler:
+                handler(orchestrator, kb, rest[0] if rest else "")
             else:
                 # Treat as a request
-                if user_input:
-                    process_request(orchestrator, user_input, execute=False)
+                process_request(orchestrator, user_input, execute=False)
 
         except KeyboardInterrupt:
             print("\n\n  Interrupted. Type 'quit' to exit.\n")
@@ -241,6 +299,8 @@ Examples:
         """
     )
 
+    parser.add_argument("--no-banner", action="store_true", help="Do not print the banner")
+
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # Team command
@@ -258,27 +318,32 @@ Examples:
     consult_parser = subparsers.add_parser("consult", help="Consult a specific agent")
     consult_parser.add_argument("agent", help="Agent name (atlas, nova, cipher, etc.)")
     consult_parser.add_argument("query", nargs="?", help="Optional query")
+    consult_parser.add_argument("--pretty", action="store_true", help="Indent the JSON response")
 
     args = parser.parse_args()
 
+    # Imported after argument parsing so --help does not build the agent team
+    sys.path.insert(0, str(Path(__file__).parent / "agents"))
+    from core.orchestrator import get_orchestrator
+    from knowledge.payverse_kb import get_knowledge_base
+
     # Initialize orchestrator
     orchestrator = get_orchestrator()
 
+    if args.command and not args.no_banner:
+        print_banner()
+
     if not args.command:
         # Interactive mode
-        interactive_mode(orchestrator)
+        interactive_mode(orchestrator, get_knowledge_base(), show_banner=not args.no_banner)
     elif args.command == "team":
-        print_banner()
         show_team_roster(orchestrator)
     elif args.command == "status":
-        print_banner()
-        show_status(orchestrator)
+        show_status(orchestrator, get_knowledge_base())
     elif args.command == "ask":
-        print_banner()
         process_request(orchestrator, args.request, execute=args.execute)
     elif args.command == "consult":
-        print_banner()
-        consult_agent(orchestrator, args.agent, args.query)
+        consult_agent(orchestrator, args.agent, args.query, pretty=args.pretty)
 
 
 if __name__ == "__main__":
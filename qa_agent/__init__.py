@@ -5,7 +5,7 @@ An intelligent QA testing agent equipped with MCP browser automation
 capabilities for comprehensive web application testing.
 """
 
-from .agent import QATestingAgent, AgentConfig
+from .agent import QATestingAgent, AgentConfig, ActionResult, ContentItem
 from .scenarios import TestScenario, TestStep, TestSuite, StepResult, TestResult, ScenarioTemplates
 from .assertions import Assertions, expect
 from .reporter import TestReporter
@@ -16,6 +16,8 @@ __author__ = "Zarah"
 __all__ = [
     "QATestingAgent",
     "AgentConfig",
+    "ActionResult",
+    "ContentItem",
     "TestScenario",
     "TestStep",
     "TestSuite",
@@ -10,20 +10,87 @@ import asyncio
 import json
 import os
 import re
-import base64
-from datetime import datetime
-from typing import Any, Callable
+import binascii
+import importlib.util
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Literal
 from dataclasses import dataclass, field
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.types import CallToolResult, TextContent
 
-from .scenarios import TestScenario, TestStep, TestSuite, StepResult, TestResult
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # Optional; element checks fall back to substring heuristics
+    HTMLParser = None
+
+from .scenarios import ActionType, TestScenario, TestStep, TestSuite, StepResult, TestResult
 from .assertions import Assertions
 from .reporter import TestReporter
 
 
+# Base64 characters decoded per write; a multiple of 4 keeps every chunk
+# aligned to whole base64 quanta
+_B64_CHUNK = 64 * 1024
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+# Step actions used by the quick-test builders. Taken from ActionType, like
+# the handler table keys, so both share one interned string per action
+_ACTION_NAVIGATE = ActionType.NAVIGATE.value
+_ACTION_TYPE = ActionType.TYPE.value
+_ACTION_CLICK = ActionType.CLICK.value
+_ACTION_WAIT = ActionType.WAIT.value
+_ACTION_SCREENSHOT = ActionType.SCREENSHOT.value
+_ACTION_ASSERT_TEXT = ActionType.ASSERT_TEXT.value
+
+# <title> sits in <head>, so it is almost always within the first few KB
+_TITLE_SCAN_LIMIT = 8192
+
+
+@lru_cache(maxsize=256)
+def _parse_selector(selector: str) -> tuple[str, Any]:
+    """Reduce a CSS selector to a (kind, needle) pair for HTML matching."""
+    if selector.startswith("#"):
+        ident = selector[1:]
+        return "id", (f'id="{ident}"', f"id='{ident}'")
+    if selector.startswith("."):
+        # Class name as a whole word inside a class attribute
+        return "class", re.compile(
+            r"""class\s*=\s*["']?[^"'>]*(?<![\w-])""" + re.escape(selector[1:]) + r"(?![\w-])",
+            re.IGNORECASE,
+        )
+    return "tag", f"<{selector.lower()}"
+
+
+@lru_cache(maxsize=512)
+def _fold(text: str) -> str:
+    """Casefold a short string (assertion target, URL) once per distinct value."""
+    return text.casefold()
+
+
+@dataclass(slots=True)
+class ContentItem:
+    """A single text or image block from a tool response."""
+    type: str
+    text: str | None = None
+    data: str | None = None
+    mime_type: str = "image/png"
+
+
+@dataclass(slots=True)
+class ActionResult:
+    """Outcome of one browser tool call."""
+    success: bool
+    error: str | None = None
+    content: list[ContentItem] = field(default_factory=list)
+
+
 @dataclass
 class AgentConfig:
     """Configuration for the QA Testing Agent."""
@@ -34,9 +101,38 @@ class AgentConfig:
     default_timeout: int = 30000
     retry_attempts: int = 3
     retry_delay: float = 1.0
+    max_parallel: int = 4
+    # "inproc" runs the browser server's tools in this process (same venv)
+    transport: Literal["stdio", "inproc"] = "stdio"
     verbose: bool = True
 
 
+class _InProcessSession:
+    """
+    Stand-in for ClientSession that calls the browser server in-process.
+
+    Only the call_tool surface the agent uses is provided. Each instance
+    owns its own BrowserSession, so parallel scenarios get separate pages.
+    """
+
+    def __init__(self, server):
+        self._server = server
+        self._browser = server.BrowserSession()
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> CallToolResult:
+        try:
+            content = await self._server.run_tool(self._browser, name, arguments or {})
+        except Exception as e:
+            return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
+        return CallToolResult(content=content)
+
+    async def aclose(self):
+        """Shut down this session's browser and wait for teardown to finish."""
+        await self._server.run_tool(self._browser, "browser_close", {})
+        if self._browser.close_task is not None:
+            await self._browser.close_task
+
+
 class QATestingAgent:
     """
     ZARAH - Expert Browser QA Testing Agent.
@@ -52,21 +148,61 @@ class QATestingAgent:
         self.assertions = Assertions()
         self.reporter = TestReporter(self.config.report_dir)
         self.current_url: str = ""
+        # Last navigated URL per session, so parallel scenarios don't share one
+        self._session_urls: dict[ClientSession, str] = {}
+        # Screenshot writes still in flight per session, awaited at scenario end
+        self._pending_screenshots: dict[ClientSession, list[asyncio.Task]] = {}
         self.test_results: list[TestResult] = []
+        self._inproc_server = None
+        # Last HTML seen by assert_element and its lowercased form / parsed tree
+        self._html_lower_cache: tuple[str, str] = ("", "")
+        self._html_tree_cache: tuple[str, Any] = ("", None)
+        # Last page text seen by assert_text and its casefolded form
+        self._content_fold_cache: tuple[str, str] = ("", "")
+        # Step action -> handler coroutine, looked up once per step
+        self._handlers: dict[str, Callable[[ClientSession, TestStep, StepResult], Awaitable[ActionResult]]] = {
+            ActionType.NAVIGATE.value: self._do_navigate,
+            ActionType.CLICK.value: self._do_click,
+            ActionType.TYPE.value: self._do_type,
+            ActionType.WAIT.value: self._do_wait,
+            ActionType.SCROLL.value: self._do_scroll,
+            ActionType.SCREENSHOT.value: self._do_screenshot,
+            ActionType.ASSERT_TEXT.value: self._do_assert_text,
+            ActionType.ASSERT_ELEMENT.value: self._do_assert_element,
+            ActionType.ASSERT_URL.value: self._do_assert_url,
+            ActionType.ASSERT_TITLE.value: self._do_assert_title,
+        }
 
         # Ensure directories exist
         os.makedirs(self.config.screenshot_dir, exist_ok=True)
         os.makedirs(self.config.report_dir, exist_ok=True)
 
-    def log(self, message: str, level: str = "INFO"):
-        """Log a message if verbose mode is enabled."""
-        if self.config.verbose:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            print(f"[{timestamp}] [{level}] {message}")
+    def log(self, message: str, level: str = "INFO", *args):
+        """
+        Log a message if verbose mode is enabled.
+
+        Extra args are %-formatted into the message only when it is printed,
+        so hot call sites pay nothing for formatting when verbose is off.
+        """
+        if not self.config.verbose:
+            return
+        if args:
+            message = message % args
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        print(f"[{timestamp}] [{level}] {message}")
 
     @asynccontextmanager
     async def _get_session(self):
         """Get an MCP session context."""
+        if self.config.transport == "inproc":
+            session = _InProcessSession(await self._load_inproc_server())
+            try:
+                yield session
+            finally:
+                self._session_urls.pop(session, None)
+                await session.aclose()
+            return
+
         server_params = StdioServerParameters(
             command=self.config.server_command,
             args=[self.config.server_script],
@@ -76,224 +212,326 @@ class QATestingAgent:
         async with stdio_client(server_params) as (read, write):
             async with ClientSession(read, write) as session:
                 await session.initialize()
-                yield session
-
-    async def _call_tool_in_session(self, session: ClientSession, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
-        """Execute a tool call through an existing MCP session."""
+                try:
+                    yield session
+                finally:
+                    self._session_urls.pop(session, None)
+
+    async def _load_inproc_server(self):
+        """Import the browser server module from config.server_script once."""
+        if self._inproc_server is None:
+            self._inproc_server = await asyncio.to_thread(self._import_server_script)
+        return self._inproc_server
+
+    def _import_server_script(self):
+        name = os.path.splitext(os.path.basename(self.config.server_script))[0]
+        module = sys.modules.get(name)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(name, self.config.server_script)
+            module = importlib.util.module_from_spec(spec)
+            # Registered before exec so dataclasses can resolve the module
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+        return module
+
+    async def _call_tool_in_session(
+        self, session: ClientSession, name: str, arguments: dict[str, Any], *, collect_content: bool = True
+    ) -> ActionResult:
+        """
+        Execute a tool call through an existing MCP session.
+
+        Callers that only care about success/error pass collect_content=False
+        so text and image payloads are not copied into the response.
+        """
         result = await session.call_tool(name, arguments)
 
-        response = {"success": True, "content": []}
-        for content in result.content:
-            if hasattr(content, "text"):
-                response["content"].append({"type": "text", "text": content.text})
-                if "Error:" in content.text:
-                    response["success"] = False
-                    response["error"] = content.text
-            elif hasattr(content, "data"):
-                response["content"].append({
-                    "type": "image",
-                    "data": content.data,
-                    "mimeType": getattr(content, "mimeType", "image/png")
-                })
+        response = ActionResult(success=not result.isError)
+        if collect_content:
+            mime_type = None
+            items = response.content
+            for content in result.content:
+                if hasattr(content, "text"):
+                    items.append(ContentItem("text", text=content.text))
+                elif hasattr(content, "data"):
+                    if mime_type is None:
+                        mime_type = getattr(content, "mimeType", "image/png")
+                    items.append(ContentItem("image", data=content.data, mime_type=mime_type))
+        if result.isError:
+            # The server reports failures structurally; the text is only detail
+            response.error = next(
+                (content.text for content in result.content if hasattr(content, "text")),
+                f"{name} failed"
+            )
 
         return response
 
-    def _save_screenshot(self, data: str, name: str) -> str:
-        """Save screenshot data to file."""
+    async def _save_screenshot(self, data: str, name: str) -> str:
+        """Save screenshot data to file without blocking the event loop."""
+        return await asyncio.to_thread(self._save_screenshot_sync, data, name)
+
+    def _save_screenshot_sync(self, data: str, name: str) -> str:
+        """Decode and write screenshot data to file."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{name}_{timestamp}.png"
         filepath = os.path.join(self.config.screenshot_dir, filename)
 
+        # Decode in bounded chunks so peak memory doesn't scale with image size
         with open(filepath, "wb") as f:
-            f.write(base64.b64decode(data))
+            for i in range(0, len(data), _B64_CHUNK):
+                f.write(binascii.a2b_base64(data[i:i + _B64_CHUNK]))
 
         return filepath
 
     # ========== Test Execution ==========
 
-    async def run_step_in_session(self, session: ClientSession, step: TestStep) -> StepResult:
-        """Execute a single test step within an existing session."""
-        start_time = datetime.now()
-        result = StepResult(
-            step=step,
-            status="pending",
-            start_time=start_time
+    async def _do_navigate(self, session: ClientSession, step: TestStep, result: StepResult) -> ActionResult:
+        action_result = await self._call_tool_in_session(
+            session, "browser_navigate", {"url": step.target}, collect_content=False
         )
+        if action_result.success:
+            self.current_url = self._session_urls[session] = step.target
+        return action_result
 
-        try:
-            self.log(f"Executing step: {step.name}", "STEP")
+    async def _do_click(self, session: ClientSession, step: TestStep, result: StepResult) -> ActionResult:
+        return await self._call_tool_in_session(
+            session, "browser_click", {"selector": step.target}, collect_content=False
+        )
 
-            if step.action == "navigate":
-                action_result = await self._call_tool_in_session(
-                    session, "browser_navigate", {"url": step.target}
-                )
-                if action_result["success"]:
-                    self.current_url = step.target
+    async def _do_type(self, session: ClientSession, step: TestStep, result: StepResult) -> ActionResult:
+        return await self._call_tool_in_session(
+            session, "browser_type", {"selector": step.target, "text": step.value or ""}, collect_content=False
+        )
 
-            elif step.action == "click":
-                action_result = await self._call_tool_in_session(
-                    session, "browser_click", {"selector": step.target}
-                )
+    async def _do_wait(self, session: ClientSession, step: TestStep, result: StepResult) -> ActionResult:
+        return await self._call_tool_in_session(
+            session, "browser_wait", {"selector": step.target if step.target else None, "timeout": step.timeout or 1000}, collect_content=False
+        )
 
-            elif step.action == "type":
-                action_result = await self._call_tool_in_session(
-                    session, "browser_type", {"selector": step.target, "text": step.value or ""}
-                )
+    async def _do_scroll(self, session: ClientSession, step: TestStep, result: StepResult) -> ActionResult:
+        direction = step.value or "down"
+        return await self._call_tool_in_session(
+            session, "browser_scroll", {"direction": direction, "amount": step.timeout or 500}, collect_content=False
+        )
 
-            elif step.action == "wait":
-                action_result = await self._call_tool_in_session(
-                    session, "browser_wait", {"selector": step.target if step.target else None, "timeout": step.timeout or 1000}
-                )
+    async def _do_screenshot(self, session: ClientSession, step: TestStep, result: StepResult) -> ActionResult:
+        return await self._capture_screenshot(session, step.target or step.name, result)
 
-            elif step.action == "scroll":
-                direction = step.value or "down"
-                action_result = await self._call_tool_in_session(
-                    session, "browser_scroll", {"direction": direction, "amount": step.timeout or 500}
-                )
+    async def _do_assert_text(self, session: ClientSession, step: TestStep, result: StepResult) -> ActionResult:
+        content_result = await self._call_tool_in_session(
+            session, "browser_get_content", {}
+        )
+        if content_result.success and content_result.content:
+            page_content = content_result.content[0].text or ""
+            passed = _fold(step.target) in self._casefold_content(page_content)
+            self.log("Text assertion: '%s' present = %s", "INFO", step.target, passed)
+            return ActionResult(passed)
+        return ActionResult(False, "Could not get page content")
+
+    async def _do_assert_element(self, session: ClientSession, step: TestStep, result: StepResult) -> ActionResult:
+        html_result = await self._call_tool_in_session(
+            session, "browser_get_html", {}
+        )
+        if html_result.success and html_result.content:
+            html = html_result.content[0].text or ""
+            passed = self._selector_matches_html(step.target, html)
+            self.log("Element assertion: '%s' exists = %s", "INFO", step.target, passed)
+            return ActionResult(passed)
+        return ActionResult(False, "Could not get page HTML")
+
+    async def _do_assert_url(self, session: ClientSession, step: TestStep, result: StepResult) -> ActionResult:
+        current_url = self._session_urls.get(session, "")
+        passed = _fold(step.target) in _fold(current_url)
+        self.log("URL assertion: '%s' in '%s' = %s", "INFO", step.target, current_url, passed)
+        return ActionResult(passed)
+
+    async def _do_assert_title(self, session: ClientSession, step: TestStep, result: StepResult) -> ActionResult:
+        html_result = await self._call_tool_in_session(
+            session, "browser_get_html", {}
+        )
+        if html_result.success and html_result.content:
+            html = html_result.content[0].text or ""
+            title_match = _TITLE_RE.search(html, 0, _TITLE_SCAN_LIMIT) or _TITLE_RE.search(html)
+            if title_match:
+                title = title_match.group(1)
+                passed = _fold(step.target) in title.casefold()
+                self.log("Title assertion: '%s' in '%s' = %s", "INFO", step.target, title, passed)
+                return ActionResult(passed)
+            return ActionResult(False, "No title found")
+        return ActionResult(False, "Could not get page HTML")
+
+    async def _capture_screenshot(self, session: ClientSession, name: str, result: StepResult) -> ActionResult:
+        """
+        Capture a screenshot now and save it to disk in the background.
+
+        The capture stays in step order so it shows the page the step saw;
+        decoding and writing the file overlap with the following steps and
+        are awaited by _flush_screenshots when the scenario ends.
+        """
+        action_result = await self._call_tool_in_session(
+            session, "browser_screenshot", {}
+        )
+        if action_result.success:
+            for content in action_result.content:
+                if content.type == "image":
+                    task = asyncio.create_task(self._save_step_screenshot(content.data, name, result))
+                    self._pending_screenshots.setdefault(session, []).append(task)
+                    break
+        return action_result
+
+    async def _save_step_screenshot(self, data: str, name: str, result: StepResult):
+        filepath = await self._save_screenshot(data, name)
+        self.log("Screenshot saved: %s", "INFO", filepath)
+        result.screenshot = filepath
+
+    async def _flush_screenshots(self, session: ClientSession):
+        """Wait for a session's background screenshot writes to finish."""
+        pending = self._pending_screenshots.pop(session, None)
+        if not pending:
+            return
+        for outcome in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(outcome, Exception):
+                self.log("Screenshot save failed: %s", "ERROR", outcome)
 
-            elif step.action == "screenshot":
-                action_result = await self._call_tool_in_session(
-                    session, "browser_screenshot", {}
-                )
-                if action_result["success"]:
-                    for content in action_result["content"]:
-                        if content.get("type") == "image":
-                            filepath = self._save_screenshot(content["data"], step.target or step.name)
-                            self.log(f"Screenshot saved: {filepath}")
-                            result.screenshot = filepath
-                            break
-
-            elif step.action == "assert_text":
-                content_result = await self._call_tool_in_session(
-                    session, "browser_get_content", {}
-                )
-                if content_result["success"] and content_result["content"]:
-                    page_content = content_result["content"][0].get("text", "")
-                    passed = step.target.lower() in page_content.lower()
-                    self.log(f"Text assertion: '{step.target}' present = {passed}")
-                    action_result = {"success": passed}
-                else:
-                    action_result = {"success": False, "error": "Could not get page content"}
-
-            elif step.action == "assert_element":
-                html_result = await self._call_tool_in_session(
-                    session, "browser_get_html", {}
-                )
-                if html_result["success"] and html_result["content"]:
-                    html = html_result["content"][0].get("text", "")
-                    passed = self._selector_matches_html(step.target, html)
-                    self.log(f"Element assertion: '{step.target}' exists = {passed}")
-                    action_result = {"success": passed}
-                else:
-                    action_result = {"success": False, "error": "Could not get page HTML"}
-
-            elif step.action == "assert_url":
-                passed = step.target.lower() in self.current_url.lower()
-                self.log(f"URL assertion: '{step.target}' in '{self.current_url}' = {passed}")
-                action_result = {"success": passed}
-
-            elif step.action == "assert_title":
-                html_result = await self._call_tool_in_session(
-                    session, "browser_get_html", {}
-                )
-                if html_result["success"] and html_result["content"]:
-                    html = html_result["content"][0].get("text", "")
-                    title_match = re.search(r"<title>(.*?)</title>", html, re.IGNORECASE)
-                    if title_match:
-                        title = title_match.group(1)
-                        passed = step.target.lower() in title.lower()
-                        self.log(f"Title assertion: '{step.target}' in '{title}' = {passed}")
-                        action_result = {"success": passed}
-                    else:
-                        action_result = {"success": False, "error": "No title found"}
-                else:
-                    action_result = {"success": False, "error": "Could not get page HTML"}
+    async def run_step_in_session(self, session: ClientSession, step: TestStep) -> StepResult:
+        """
+        Execute a single test step within an existing session.
+
+        Screenshots taken by the step are written in the background; call
+        _flush_screenshots before relying on result.screenshot.
+        """
+        # Wall clock read once for the timestamp; duration uses perf_counter
+        start_time = datetime.now()
+        t0 = time.perf_counter()
+        result = StepResult(step=step, start_time=start_time)
+
+        try:
+            self.log("Executing step: %s", "STEP", step.name)
 
+            handler = self._handlers.get(step.action)
+            if handler is not None:
+                action_result = await handler(session, step, result)
             else:
-                action_result = {"success": False, "error": f"Unknown action: {step.action}"}
+                action_result = ActionResult(False, f"Unknown action: {step.action}")
 
-            result.status = "passed" if action_result.get("success", False) else "failed"
-            result.message = action_result.get("error", "")
+            result.status = "passed" if action_result.success else "failed"
+            result.message = action_result.error or ""
 
             # Take screenshot on failure if configured
             if result.status == "failed" and step.screenshot_on_failure:
-                screenshot_result = await self._call_tool_in_session(
-                    session, "browser_screenshot", {}
-                )
-                if screenshot_result["success"]:
-                    for content in screenshot_result["content"]:
-                        if content.get("type") == "image":
-                            filepath = self._save_screenshot(content["data"], f"failure_{step.name}")
-                            self.log(f"Screenshot saved: {filepath}")
-                            result.screenshot = filepath
-                            break
+                await self._capture_screenshot(session, f"failure_{step.name}", result)
 
         except Exception as e:
             result.status = "error"
             result.message = str(e)
-            self.log(f"Step error: {e}", "ERROR")
+            self.log("Step error: %s", "ERROR", e)
 
-        result.end_time = datetime.now()
-        result.duration = (result.end_time - start_time).total_seconds()
+        result.duration = time.perf_counter() - t0
+        result.end_time = start_time + timedelta(seconds=result.duration)
 
-        status_icon = "✓" if result.status == "passed" else "✗" if result.status == "failed" else "⚠"
-        self.log(f"{status_icon} Step '{step.name}': {result.status} ({result.duration:.2f}s)")
+        if self.config.verbose:
+            status_icon = "✓" if result.status == "passed" else "✗" if result.status == "failed" else "⚠"
+            self.log(f"{status_icon} Step '{step.name}': {result.status} ({result.duration:.2f}s)")
 
         return result
 
     def _selector_matches_html(self, selector: str, html: str) -> bool:
         """Check if a CSS selector might match HTML content."""
-        if selector.startswith("#"):
-            return f'id="{selector[1:]}"' in html or f"id='{selector[1:]}'" in html
-        if selector.startswith("."):
-            return f'class="' in html and selector[1:] in html
-        return f"<{selector}" in html.lower()
+        if HTMLParser is not None:
+            try:
+                return self._parse_html(html).css_first(selector) is not None
+            except Exception:
+                # Selector the CSS engine rejects; use the heuristics below
+                pass
+
+        kind, needle = _parse_selector(selector)
+        if kind == "id":
+            return needle[0] in html or needle[1] in html
+        if kind == "class":
+            return needle.search(html) is not None
+        return needle in self._lowercase_html(html)
+
+    def _parse_html(self, html: str):
+        """Parse page HTML, reusing the tree for repeated checks of one page."""
+        cached_html, tree = self._html_tree_cache
+        if tree is None or html != cached_html:
+            tree = HTMLParser(html)
+            self._html_tree_cache = (html, tree)
+        return tree
+
+    def _lowercase_html(self, html: str) -> str:
+        """Lowercase page HTML, reusing the result for repeated checks of one page."""
+        cached_html, cached_lower = self._html_lower_cache
+        if html != cached_html:
+            cached_lower = html.lower()
+            self._html_lower_cache = (html, cached_lower)
+        return cached_lower
+
+    def _casefold_content(self, content: str) -> str:
+        """Casefold page text, reusing the result for repeated checks of one page."""
+        cached_content, cached_folded = self._content_fold_cache
+        if content != cached_content:
+            cached_folded = content.casefold()
+            self._content_fold_cache = (content, cached_folded)
+        return cached_folded
 
     async def run_scenario(self, scenario: TestScenario) -> TestResult:
-        """Execute a complete test scenario."""
-        self.log(f"\n{'='*60}")
-        self.log(f"Running Scenario: {scenario.name}")
-        self.log(f"Description: {scenario.description}")
-        self.log(f"{'='*60}\n")
+        """Execute a complete test scenario in its own MCP session."""
+        async with self._get_session() as session:
+            return await self._run_scenario_on_session(session, scenario)
+
+    async def _run_scenario_on_session(self, session: ClientSession, scenario: TestScenario) -> TestResult:
+        """Execute a complete test scenario on an existing MCP session."""
+        if self.config.verbose:
+            self.log(f"\n{'='*60}")
+            self.log(f"Running Scenario: {scenario.name}")
+            self.log(f"Description: {scenario.description}")
+            self.log(f"{'='*60}\n")
 
         start_time = datetime.now()
+        t0 = time.perf_counter()
         step_results: list[StepResult] = []
 
-        async with self._get_session() as session:
-            try:
-                # Setup
-                if scenario.setup_steps:
-                    self.log("Running setup steps...", "SETUP")
-                    for step in scenario.setup_steps:
-                        result = await self.run_step_in_session(session, step)
-                        step_results.append(result)
-                        if result.status != "passed" and step.critical:
-                            raise Exception(f"Critical setup step failed: {step.name}")
-
-                # Main test steps
-                self.log("Running test steps...", "TEST")
-                for step in scenario.steps:
+        try:
+            # Setup
+            if scenario.setup_steps:
+                self.log("Running setup steps...", "SETUP")
+                for step in scenario.setup_steps:
                     result = await self.run_step_in_session(session, step)
                     step_results.append(result)
-
                     if result.status != "passed" and step.critical:
-                        self.log(f"Critical step failed, stopping scenario", "ERROR")
-                        break
+                        raise Exception(f"Critical setup step failed: {step.name}")
+
+            # Main test steps
+            self.log("Running test steps...", "TEST")
+            for step in scenario.steps:
+                result = await self.run_step_in_session(session, step)
+                step_results.append(result)
+
+                if result.status != "passed" and step.critical:
+                    self.log("Critical step failed, stopping scenario", "ERROR")
+                    break
+
+            # Teardown
+            if scenario.teardown_steps:
+                self.log("Running teardown steps...", "TEARDOWN")
+                for step in scenario.teardown_steps:
+                    result = await self.run_step_in_session(session, step)
+                    step_results.append(result)
 
-                # Teardown
-                if scenario.teardown_steps:
-                    self.log("Running teardown steps...", "TEARDOWN")
-                    for step in scenario.teardown_steps:
-                        result = await self.run_step_in_session(session, step)
-                        step_results.append(result)
+        except Exception as e:
+            self.log("Scenario error: %s", "ERROR", e)
 
-            except Exception as e:
-                self.log(f"Scenario error: {e}", "ERROR")
+        await self._flush_screenshots(session)
 
-        end_time = datetime.now()
+        duration = time.perf_counter() - t0
+        end_time = start_time + timedelta(seconds=duration)
 
-        failed_steps = [r for r in step_results if r.status == "failed"]
-        error_steps = [r for r in step_results if r.status == "error"]
+        failed_steps = error_steps = 0
+        for r in step_results:
+            if r.status == "failed":
+                failed_steps += 1
+            elif r.status == "error":
+                error_steps += 1
 
         if error_steps:
             status = "error"
@@ -308,17 +546,18 @@ class QATestingAgent:
             step_results=step_results,
             start_time=start_time,
             end_time=end_time,
-            duration=(end_time - start_time).total_seconds()
+            duration=duration
         )
 
         self.test_results.append(test_result)
 
-        self.log(f"\n{'='*60}")
-        self.log(f"Scenario Complete: {scenario.name}")
-        self.log(f"Status: {status.upper()}")
-        self.log(f"Duration: {test_result.duration:.2f}s")
-        self.log(f"Steps: {len(step_results)} total, {len(failed_steps)} failed, {len(error_steps)} errors")
-        self.log(f"{'='*60}\n")
+        if self.config.verbose:
+            self.log(f"\n{'='*60}")
+            self.log(f"Scenario Complete: {scenario.name}")
+            self.log(f"Status: {status.upper()}")
+            self.log(f"Duration: {test_result.duration:.2f}s")
+            self.log(f"Steps: {len(step_results)} total, {failed_steps} failed, {error_steps} errors")
+            self.log(f"{'='*60}\n")
 
         return test_result
 
@@ -329,28 +568,78 @@ class QATestingAgent:
         self.log(f"# Scenarios: {len(suite.scenarios)}")
         self.log(f"{'#'*60}\n")
 
-        results = []
-        for scenario in suite.scenarios:
-            result = await self.run_scenario(scenario)
-            results.append(result)
-
-        report_path = self.reporter.generate_report(suite, results)
+        if suite.parallel and len(suite.scenarios) > 1:
+            results = await self._run_scenarios_parallel(suite.scenarios)
+        else:
+            results = []
+            async with self._get_session() as session:
+                for i, scenario in enumerate(suite.scenarios):
+                    if i:
+                        await self._reset_browser(session)
+                    result = await self._run_scenario_on_session(session, scenario)
+                    results.append(result)
+
+        # Rendering and writing the report is blocking work; keep it off the loop
+        report_path = await asyncio.to_thread(self.reporter.generate_report, suite, results)
         self.log(f"\nTest report generated: {report_path}")
 
         return results
 
+    async def _run_scenarios_parallel(self, scenarios: list[TestScenario]) -> list[TestResult]:
+        """Run scenarios concurrently on a pool of up to max_parallel sessions."""
+        results: list[TestResult | None] = [None] * len(scenarios)
+        queue: asyncio.Queue[tuple[int, TestScenario]] = asyncio.Queue()
+        for item in enumerate(scenarios):
+            queue.put_nowait(item)
+
+        async def worker():
+            async with self._get_session() as session:
+                first = True
+                while not queue.empty():
+                    index, scenario = queue.get_nowait()
+                    if not first:
+                        await self._reset_browser(session)
+                    first = False
+                    results[index] = await self._run_scenario_on_session(session, scenario)
+
+        workers = min(self.config.max_parallel, len(scenarios))
+        # Each worker closes its own session on the way out; a failing worker
+        # must not take the others down with it
+        outcomes = await asyncio.gather(
+            *(worker() for _ in range(workers)), return_exceptions=True
+        )
+        errors = [o for o in outcomes if isinstance(o, BaseException)]
+        for e in errors:
+            self.log("Parallel worker error: %s", "ERROR", e)
+
+        for index, result in enumerate(results):
+            if result is None:
+                result = TestResult(
+                    scenario=scenarios[index],
+                    status="error",
+                    error_message=str(errors[0]) if errors else "Scenario did not run",
+                )
+                self.test_results.append(result)
+                results[index] = result
+        return results
+
+    async def _reset_browser(self, session: ClientSession):
+        """Give the next scenario a fresh browser without a new server process."""
+        await self._call_tool_in_session(session, "browser_close", {})
+        self._session_urls.pop(session, None)
+
     async def close(self):
         """Cleanup method (browser closes automatically with session)."""
         self.log("Closing browser")
 
     # ========== Convenience Methods ==========
 
-    async def navigate(self, url: str) -> dict[str, Any]:
+    async def navigate(self, url: str) -> ActionResult:
         """Navigate to a URL (creates new session)."""
         self.log(f"Navigating to: {url}")
         async with self._get_session() as session:
             result = await self._call_tool_in_session(session, "browser_navigate", {"url": url})
-            if result["success"]:
+            if result.success:
                 self.current_url = url
             return result
 
@@ -358,10 +647,10 @@ class QATestingAgent:
         """Take a screenshot (creates new session)."""
         async with self._get_session() as session:
             result = await self._call_tool_in_session(session, "browser_screenshot", {})
-            if result["success"]:
-                for content in result["content"]:
-                    if content.get("type") == "image":
-                        filepath = self._save_screenshot(content["data"], name or "screenshot")
+            if result.success:
+                for content in result.content:
+                    if content.type == "image":
+                        filepath = await self._save_screenshot(content.data, name or "screenshot")
                         self.log(f"Screenshot saved: {filepath}")
                         return filepath
         return ""
@@ -370,28 +659,28 @@ class QATestingAgent:
         """Get page content (creates new session)."""
         async with self._get_session() as session:
             result = await self._call_tool_in_session(session, "browser_get_content", {})
-            if result["success"] and result["content"]:
-                return result["content"][0].get("text", "")
+            if result.success and result.content:
+                return result.content[0].text or ""
         return ""
 
-    async def click(self, selector: str) -> dict[str, Any]:
+    async def click(self, selector: str) -> ActionResult:
         """Click an element (creates new session)."""
         self.log(f"Clicking: {selector}")
         async with self._get_session() as session:
             return await self._call_tool_in_session(session, "browser_click", {"selector": selector})
 
-    async def type_text(self, selector: str, text: str) -> dict[str, Any]:
+    async def type_text(self, selector: str, text: str) -> ActionResult:
         """Type text (creates new session)."""
         self.log(f"Typing into {selector}")
         async with self._get_session() as session:
             return await self._call_tool_in_session(session, "browser_type", {"selector": selector, "text": text})
 
-    async def wait(self, selector: str = None, timeout: int = 1000) -> dict[str, Any]:
+    async def wait(self, selector: str = None, timeout: int = 1000) -> ActionResult:
         """Wait (creates new session)."""
         async with self._get_session() as session:
             return await self._call_tool_in_session(session, "browser_wait", {"selector": selector, "timeout": timeout})
 
-    async def scroll(self, direction: str = "down", amount: int = 500) -> dict[str, Any]:
+    async def scroll(self, direction: str = "down", amount: int = 500) -> ActionResult:
         """Scroll (creates new session)."""
         async with self._get_session() as session:
             return await self._call_tool_in_session(session, "browser_scroll", {"direction": direction, "amount": amount})
@@ -399,7 +688,7 @@ class QATestingAgent:
     async def assert_text_present(self, text: str) -> bool:
         """Assert text is present."""
         content = await self.get_content()
-        return text.lower() in content.lower()
+        return _fold(text) in content.casefold()
 
     async def test_page_loads(self, url: str, expected_text: str = None) -> TestResult:
         """Quick test that a page loads successfully."""
@@ -407,14 +696,14 @@ class QATestingAgent:
             name=f"Page Load Test: {url}",
             description=f"Verify that {url} loads correctly",
             steps=[
-                TestStep(name="Navigate", action="navigate", target=url, critical=True),
-                TestStep(name="Screenshot", action="screenshot", target="page_load"),
+                TestStep(name="Navigate", action=_ACTION_NAVIGATE, target=url, critical=True),
+                TestStep(name="Screenshot", action=_ACTION_SCREENSHOT, target="page_load"),
             ]
         )
 
         if expected_text:
             scenario.steps.append(
-                TestStep(name="Verify Text", action="assert_text", target=expected_text)
+                TestStep(name="Verify Text", action=_ACTION_ASSERT_TEXT, target=expected_text)
             )
 
         return await self.run_scenario(scenario)
@@ -428,22 +717,18 @@ class QATestingAgent:
     ) -> TestResult:
         """Quick test for form submission."""
         steps = [
-            TestStep(name="Navigate", action="navigate", target=url, critical=True),
+            TestStep(name="Navigate", action=_ACTION_NAVIGATE, target=url, critical=True),
+            *[
+                TestStep(name=f"Fill {selector}", action=_ACTION_TYPE, target=selector, value=value)
+                for selector, value in form_data.items()
+            ],
+            TestStep(name="Screenshot Before Submit", action=_ACTION_SCREENSHOT, target="before_submit"),
+            TestStep(name="Submit Form", action=_ACTION_CLICK, target=submit_selector, critical=True),
+            TestStep(name="Wait for Response", action=_ACTION_WAIT, timeout=2000),
+            TestStep(name="Screenshot After Submit", action=_ACTION_SCREENSHOT, target="after_submit"),
+            TestStep(name="Verify Success", action=_ACTION_ASSERT_TEXT, target=success_indicator),
         ]
 
-        for selector, value in form_data.items():
-            steps.append(
-                TestStep(name=f"Fill {selector}", action="type", target=selector, value=value)
-            )
-
-        steps.extend([
-            TestStep(name="Screenshot Before Submit", action="screenshot", target="before_submit"),
-            TestStep(name="Submit Form", action="click", target=submit_selector, critical=True),
-            TestStep(name="Wait for Response", action="wait", timeout=2000),
-            TestStep(name="Screenshot After Submit", action="screenshot", target="after_submit"),
-            TestStep(name="Verify Success", action="assert_text", target=success_indicator),
-        ])
-
         scenario = TestScenario(
             name=f"Form Submission Test: {url}",
             description="Test form submission workflow",
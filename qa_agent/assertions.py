@@ -5,12 +5,164 @@ ZARAH - Assertion and Validation Utilities
 Provides comprehensive assertion methods for test validation.
 """
 
+import operator
 import re
+import string
+import sys
 from typing import Any, Callable
 from dataclasses import dataclass
-
-
-@dataclass
+from functools import lru_cache
+from itertools import islice
+
+
+_LABEL_CHARS = frozenset(string.ascii_letters + string.digits + "-")
+_TLD_CHARS = frozenset(string.ascii_letters)
+_DIGITS = frozenset(string.digits)
+
+_STRIP_TAGS_RE = re.compile(r'<[^>]+>')
+
+
+# re.compile keyed on the pattern string, for patterns passed to matches_regex
+_compile = lru_cache(maxsize=1024)(re.compile)
+
+# Plain tag names take the str.find path; anything else goes through _tag_re
+_TAG_NAME_RE = re.compile(r'[A-Za-z][\w:-]*')
+
+# Characters that can end a tag name inside an opening tag
+_TAG_NAME_END = frozenset(' \t\n\r\f/>')
+
+
+@lru_cache(maxsize=1024)
+def _attr_re(tag: str, attribute: str, value: str | None) -> re.Pattern:
+    """Compile the has_attribute pattern once per (tag, attribute, value)."""
+    if value:
+        pattern = f'<{tag}[^>]*{attribute}=["\']?{re.escape(value)}["\']?[^>]*>'
+    else:
+        pattern = f'<{tag}[^>]*{attribute}[^>]*>'
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _is_valid_host(host: str) -> bool:
+    """Accept a dotted domain name, localhost, or a dotted-quad address."""
+    if host.lower() == "localhost":
+        return True
+    parts = host.split(".")
+    if len(parts) == 4 and all(0 < len(p) <= 3 and _DIGITS.issuperset(p) for p in parts):
+        return True
+    if parts[-1] == "":
+        # One trailing dot is allowed after the TLD
+        parts.pop()
+    if len(parts) < 2:
+        return False
+    tld = parts.pop()
+    if not (2 <= len(tld) <= 6 and _TLD_CHARS.issuperset(tld)):
+        return False
+    for label in parts:
+        if not (0 < len(label) <= 63 and _LABEL_CHARS.issuperset(label)):
+            return False
+        if label[0] == "-" or label[-1] == "-":
+            return False
+    return True
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_url(url: str) -> bool:
+    """Validate an http(s) URL in one linear pass, without a regex."""
+    scheme = url[:8].lower()
+    if scheme == "https://":
+        rest = url[8:]
+    elif scheme.startswith("http://"):
+        rest = url[7:]
+    else:
+        return False
+
+    # Authority runs up to the first "/" or "?"
+    end = len(rest)
+    for sep in "/?":
+        i = rest.find(sep, 0, end)
+        if i != -1:
+            end = i
+    authority, tail = rest[:end], rest[end:]
+
+    host, colon, port = authority.partition(":")
+    if colon and not (port and _DIGITS.issuperset(port)):
+        return False
+    if not _is_valid_host(host):
+        return False
+
+    # Nothing, a bare "/", or "/" / "?" followed by non-whitespace
+    if len(tail) <= 1:
+        return tail != "?"
+    return not any(map(str.isspace, tail))
+
+
+def _text_outside_tags(html: str, text: str) -> bool:
+    """Find text in raw HTML at a position not inside a <...> tag."""
+    if "<" in text or ">" in text:
+        return False
+    i = html.find(text)
+    while i != -1:
+        # Inside a tag when a "<" opened after the last ">" and a ">" closes it later
+        opened = html.rfind("<", 0, i) > html.rfind(">", 0, i)
+        if not opened or html.find(">", i + len(text)) == -1:
+            return True
+        i = html.find(text, i + 1)
+    return False
+
+
+def _has_open_tag(html: str, tag: str) -> bool:
+    """Find an opening <tag ...> with a plain substring scan."""
+    lowered = html.lower()
+    needle = '<' + tag.lower()
+    size = len(lowered)
+    i = lowered.find(needle)
+    while i != -1:
+        end = i + len(needle)
+        if end < size and lowered[end] in _TAG_NAME_END:
+            return lowered.find('>', end) != -1
+        i = lowered.find(needle, end)
+    return False
+
+
+@lru_cache(maxsize=512)
+def _tag_re(tag: str) -> re.Pattern:
+    """Compile the opening-tag pattern for html_contains_tag once per tag."""
+    return re.compile(f"<{tag}[^>]*>", re.IGNORECASE)
+
+
+class AssertionType:
+    """Interned assertion_type values, so grouping results by type hashes by identity."""
+    EQUALS = sys.intern("equals")
+    NOT_EQUALS = sys.intern("not_equals")
+    IS_TRUE = sys.intern("is_true")
+    IS_FALSE = sys.intern("is_false")
+    IS_NONE = sys.intern("is_none")
+    IS_NOT_NONE = sys.intern("is_not_none")
+    CONTAINS = sys.intern("contains")
+    NOT_CONTAINS = sys.intern("not_contains")
+    STARTS_WITH = sys.intern("starts_with")
+    ENDS_WITH = sys.intern("ends_with")
+    MATCHES_REGEX = sys.intern("matches_regex")
+    IS_EMPTY = sys.intern("is_empty")
+    IS_NOT_EMPTY = sys.intern("is_not_empty")
+    GREATER_THAN = sys.intern("greater_than")
+    GREATER_THAN_OR_EQUAL = sys.intern("greater_than_or_equal")
+    LESS_THAN = sys.intern("less_than")
+    LESS_THAN_OR_EQUAL = sys.intern("less_than_or_equal")
+    BETWEEN = sys.intern("between")
+    HAS_LENGTH = sys.intern("has_length")
+    CONTAINS_ITEM = sys.intern("contains_item")
+    ALL_MATCH = sys.intern("all_match")
+    ANY_MATCH = sys.intern("any_match")
+    IS_TYPE = sys.intern("is_type")
+    IS_VALID_URL = sys.intern("is_valid_url")
+    URL_CONTAINS_PATH = sys.intern("url_contains_path")
+    HTML_CONTAINS_TAG = sys.intern("html_contains_tag")
+    HTML_CONTAINS_TEXT = sys.intern("html_contains_text")
+    HAS_ATTRIBUTE = sys.intern("has_attribute")
+
+
+@dataclass(slots=True)
 class AssertionResult:
     """Result of an assertion check."""
     passed: bool
@@ -19,6 +171,35 @@ class AssertionResult:
     message: str
     assertion_type: str
 
+    @classmethod
+    def _make(cls, passed: bool, expected: Any, actual: Any, message: str, assertion_type: str) -> "AssertionResult":
+        """Positional constructor that skips the generated __init__."""
+        result = object.__new__(cls)
+        result.passed = passed
+        result.expected = expected
+        result.actual = actual
+        result.message = message
+        result.assertion_type = assertion_type
+        return result
+
+
+def _comparison(op: Callable[[Any, Any], bool], symbol: str, assertion_type: str, relation: str):
+    """Build a numeric comparison assertion method around an operator function."""
+    def check(self, actual: float, expected: float, message: str = "") -> bool:
+        if op(actual, expected):
+            return True
+        return self._fail(
+            expected=f"{symbol} {expected}",
+            actual=actual,
+            message=message or f"Expected {actual} {symbol} {expected}",
+            assertion_type=assertion_type
+        )
+
+    check.__name__ = assertion_type
+    check.__qualname__ = f"Assertions.{assertion_type}"
+    check.__doc__ = f"Assert that actual is {relation} expected."
+    return check
+
 
 class Assertions:
     """
@@ -44,381 +225,331 @@ class Assertions:
         """Get all soft assertion failures."""
         return self.failures.copy()
 
-    def _handle_result(self, result: AssertionResult) -> bool:
-        """Handle assertion result based on mode."""
-        if not result.passed:
-            if self.soft_mode:
-                self.failures.append(result)
-            # In hard mode, just return False (caller handles it)
-        return result.passed
+    def _fail(self, expected: Any, actual: Any, message: str, assertion_type: str) -> bool:
+        """
+        Record a failed assertion and return False.
+
+        Assertions return True directly when they pass, so results and their
+        messages are only built for failures.
+        """
+        if self.soft_mode:
+            self.failures.append(AssertionResult._make(False, expected, actual, message, assertion_type))
+        # In hard mode, just return False (caller handles it)
+        return False
 
     # ========== Equality Assertions ==========
 
     def equals(self, actual: Any, expected: Any, message: str = "") -> bool:
         """Assert that actual equals expected."""
-        passed = actual == expected
-        result = AssertionResult(
-            passed=passed,
+        if actual == expected:
+            return True
+        return self._fail(
             expected=expected,
             actual=actual,
             message=message or f"Expected {expected}, got {actual}",
-            assertion_type="equals"
+            assertion_type=AssertionType.EQUALS
         )
-        return self._handle_result(result)
 
     def not_equals(self, actual: Any, expected: Any, message: str = "") -> bool:
         """Assert that actual does not equal expected."""
-        passed = actual != expected
-        result = AssertionResult(
-            passed=passed,
+        if actual != expected:
+            return True
+        return self._fail(
             expected=f"not {expected}",
             actual=actual,
             message=message or f"Expected not {expected}, got {actual}",
-            assertion_type="not_equals"
+            assertion_type=AssertionType.NOT_EQUALS
         )
-        return self._handle_result(result)
 
     def is_true(self, value: Any, message: str = "") -> bool:
         """Assert that value is truthy."""
-        passed = bool(value)
-        result = AssertionResult(
-            passed=passed,
+        if value:
+            return True
+        return self._fail(
             expected=True,
             actual=value,
             message=message or f"Expected truthy value, got {value}",
-            assertion_type="is_true"
+            assertion_type=AssertionType.IS_TRUE
         )
-        return self._handle_result(result)
 
     def is_false(self, value: Any, message: str = "") -> bool:
         """Assert that value is falsy."""
-        passed = not bool(value)
-        result = AssertionResult(
-            passed=passed,
+        if not value:
+            return True
+        return self._fail(
             expected=False,
             actual=value,
             message=message or f"Expected falsy value, got {value}",
-            assertion_type="is_false"
+            assertion_type=AssertionType.IS_FALSE
         )
-        return self._handle_result(result)
 
     def is_none(self, value: Any, message: str = "") -> bool:
         """Assert that value is None."""
-        passed = value is None
-        result = AssertionResult(
-            passed=passed,
+        if value is None:
+            return True
+        return self._fail(
             expected=None,
             actual=value,
             message=message or f"Expected None, got {value}",
-            assertion_type="is_none"
+            assertion_type=AssertionType.IS_NONE
         )
-        return self._handle_result(result)
 
     def is_not_none(self, value: Any, message: str = "") -> bool:
         """Assert that value is not None."""
-        passed = value is not None
-        result = AssertionResult(
-            passed=passed,
+        if value is not None:
+            return True
+        return self._fail(
             expected="not None",
             actual=value,
-            message=message or f"Expected not None, got None",
-            assertion_type="is_not_none"
+            message=message or "Expected not None, got None",
+            assertion_type=AssertionType.IS_NOT_NONE
         )
-        return self._handle_result(result)
 
     # ========== String Assertions ==========
 
     def contains(self, haystack: str, needle: str, message: str = "") -> bool:
         """Assert that haystack contains needle."""
-        passed = needle in str(haystack)
-        result = AssertionResult(
-            passed=passed,
+        text = haystack if haystack.__class__ is str else str(haystack)
+        if needle in text:
+            return True
+        return self._fail(
             expected=f"contains '{needle}'",
-            actual=haystack[:100] if len(str(haystack)) > 100 else haystack,
+            actual=text[:100] if len(text) > 100 else haystack,
             message=message or f"Expected '{needle}' to be in string",
-            assertion_type="contains"
+            assertion_type=AssertionType.CONTAINS
         )
-        return self._handle_result(result)
 
     def not_contains(self, haystack: str, needle: str, message: str = "") -> bool:
         """Assert that haystack does not contain needle."""
-        passed = needle not in str(haystack)
-        result = AssertionResult(
-            passed=passed,
+        text = haystack if haystack.__class__ is str else str(haystack)
+        if needle not in text:
+            return True
+        return self._fail(
             expected=f"not contains '{needle}'",
-            actual=haystack[:100] if len(str(haystack)) > 100 else haystack,
+            actual=text[:100] if len(text) > 100 else haystack,
             message=message or f"Expected '{needle}' to not be in string",
-            assertion_type="not_contains"
+            assertion_type=AssertionType.NOT_CONTAINS
         )
-        return self._handle_result(result)
 
     def starts_with(self, string: str, prefix: str, message: str = "") -> bool:
         """Assert that string starts with prefix."""
-        passed = str(string).startswith(prefix)
-        result = AssertionResult(
-            passed=passed,
+        text = string if string.__class__ is str else str(string)
+        if text.startswith(prefix):
+            return True
+        return self._fail(
             expected=f"starts with '{prefix}'",
-            actual=string[:len(prefix) + 20] if len(str(string)) > len(prefix) + 20 else string,
+            actual=text[:len(prefix) + 20] if len(text) > len(prefix) + 20 else string,
             message=message or f"Expected string to start with '{prefix}'",
-            assertion_type="starts_with"
+            assertion_type=AssertionType.STARTS_WITH
         )
-        return self._handle_result(result)
 
     def ends_with(self, string: str, suffix: str, message: str = "") -> bool:
         """Assert that string ends with suffix."""
-        passed = str(string).endswith(suffix)
-        result = AssertionResult(
-            passed=passed,
+        text = string if string.__class__ is str else str(string)
+        if text.endswith(suffix):
+            return True
+        return self._fail(
             expected=f"ends with '{suffix}'",
-            actual=string[-len(suffix) - 20:] if len(str(string)) > len(suffix) + 20 else string,
+            actual=text[-len(suffix) - 20:] if len(text) > len(suffix) + 20 else string,
             message=message or f"Expected string to end with '{suffix}'",
-            assertion_type="ends_with"
+            assertion_type=AssertionType.ENDS_WITH
         )
-        return self._handle_result(result)
 
-    def matches_regex(self, string: str, pattern: str, message: str = "") -> bool:
-        """Assert that string matches regex pattern."""
-        passed = bool(re.search(pattern, str(string)))
-        result = AssertionResult(
-            passed=passed,
+    def matches_regex(self, string: str, pattern: str | re.Pattern, message: str = "") -> bool:
+        """Assert that string matches regex pattern (a string or a compiled pattern)."""
+        text = string if string.__class__ is str else str(string)
+        if isinstance(pattern, re.Pattern):
+            compiled, pattern = pattern, pattern.pattern
+        else:
+            compiled = _compile(pattern)
+        if compiled.search(text):
+            return True
+        return self._fail(
             expected=f"matches /{pattern}/",
-            actual=string[:100] if len(str(string)) > 100 else string,
+            actual=text[:100] if len(text) > 100 else string,
             message=message or f"Expected string to match pattern '{pattern}'",
-            assertion_type="matches_regex"
+            assertion_type=AssertionType.MATCHES_REGEX
         )
-        return self._handle_result(result)
 
     def is_empty(self, value: str, message: str = "") -> bool:
         """Assert that string is empty."""
-        passed = len(str(value)) == 0
-        result = AssertionResult(
-            passed=passed,
+        if (value if value.__class__ is str else str(value)) == "":
+            return True
+        return self._fail(
             expected="empty string",
             actual=value,
             message=message or f"Expected empty string, got '{value}'",
-            assertion_type="is_empty"
+            assertion_type=AssertionType.IS_EMPTY
         )
-        return self._handle_result(result)
 
     def is_not_empty(self, value: str, message: str = "") -> bool:
         """Assert that string is not empty."""
-        passed = len(str(value)) > 0
-        result = AssertionResult(
-            passed=passed,
+        if (value if value.__class__ is str else str(value)) != "":
+            return True
+        return self._fail(
             expected="non-empty string",
             actual=value,
             message=message or "Expected non-empty string, got empty",
-            assertion_type="is_not_empty"
+            assertion_type=AssertionType.IS_NOT_EMPTY
         )
-        return self._handle_result(result)
 
     # ========== Numeric Assertions ==========
 
-    def greater_than(self, actual: float, expected: float, message: str = "") -> bool:
-        """Assert that actual is greater than expected."""
-        passed = actual > expected
-        result = AssertionResult(
-            passed=passed,
-            expected=f"> {expected}",
-            actual=actual,
-            message=message or f"Expected {actual} > {expected}",
-            assertion_type="greater_than"
-        )
-        return self._handle_result(result)
-
-    def greater_than_or_equal(self, actual: float, expected: float, message: str = "") -> bool:
-        """Assert that actual is greater than or equal to expected."""
-        passed = actual >= expected
-        result = AssertionResult(
-            passed=passed,
-            expected=f">= {expected}",
-            actual=actual,
-            message=message or f"Expected {actual} >= {expected}",
-            assertion_type="greater_than_or_equal"
-        )
-        return self._handle_result(result)
-
-    def less_than(self, actual: float, expected: float, message: str = "") -> bool:
-        """Assert that actual is less than expected."""
-        passed = actual < expected
-        result = AssertionResult(
-            passed=passed,
-            expected=f"< {expected}",
-            actual=actual,
-            message=message or f"Expected {actual} < {expected}",
-            assertion_type="less_than"
-        )
-        return self._handle_result(result)
-
-    def less_than_or_equal(self, actual: float, expected: float, message: str = "") -> bool:
-        """Assert that actual is less than or equal to expected."""
-        passed = actual <= expected
-        result = AssertionResult(
-            passed=passed,
-            expected=f"<= {expected}",
-            actual=actual,
-            message=message or f"Expected {actual} <= {expected}",
-            assertion_type="less_than_or_equal"
-        )
-        return self._handle_result(result)
+    greater_than = _comparison(operator.gt, ">", AssertionType.GREATER_THAN, "greater than")
+    greater_than_or_equal = _comparison(operator.ge, ">=", AssertionType.GREATER_THAN_OR_EQUAL, "greater than or equal to")
+    less_than = _comparison(operator.lt, "<", AssertionType.LESS_THAN, "less than")
+    less_than_or_equal = _comparison(operator.le, "<=", AssertionType.LESS_THAN_OR_EQUAL, "less than or equal to")
 
     def between(self, actual: float, min_val: float, max_val: float, message: str = "") -> bool:
         """Assert that actual is between min and max (inclusive)."""
-        passed = min_val <= actual <= max_val
-        result = AssertionResult(
-            passed=passed,
+        if min_val <= actual <= max_val:
+            return True
+        return self._fail(
             expected=f"between {min_val} and {max_val}",
             actual=actual,
             message=message or f"Expected {actual} to be between {min_val} and {max_val}",
-            assertion_type="between"
+            assertion_type=AssertionType.BETWEEN
         )
-        return self._handle_result(result)
 
     # ========== Collection Assertions ==========
 
     def has_length(self, collection: Any, expected_length: int, message: str = "") -> bool:
-        """Assert that collection has expected length."""
-        actual_length = len(collection)
-        passed = actual_length == expected_length
-        result = AssertionResult(
-            passed=passed,
+        """Assert that collection has expected length (iterators are consumed)."""
+        try:
+            actual_length = len(collection)
+        except TypeError:
+            # Unsized iterable: count, but stop as soon as it is too long
+            actual_length = sum(1 for _ in islice(collection, expected_length + 1))
+            if actual_length > expected_length:
+                actual_length = f"> {expected_length}"
+        if actual_length == expected_length:
+            return True
+        return self._fail(
             expected=f"length {expected_length}",
             actual=f"length {actual_length}",
             message=message or f"Expected length {expected_length}, got {actual_length}",
-            assertion_type="has_length"
+            assertion_type=AssertionType.HAS_LENGTH
         )
-        return self._handle_result(result)
 
     def contains_item(self, collection: list, item: Any, message: str = "") -> bool:
         """Assert that collection contains item."""
-        passed = item in collection
-        result = AssertionResult(
-            passed=passed,
+        if item in collection:
+            return True
+        if not self.soft_mode:
+            return False
+        return self._fail(
             expected=f"contains {item}",
-            actual=collection[:5] if len(collection) > 5 else collection,
+            actual=list(islice(collection, 5)),
             message=message or f"Expected collection to contain {item}",
-            assertion_type="contains_item"
+            assertion_type=AssertionType.CONTAINS_ITEM
         )
-        return self._handle_result(result)
 
     def all_match(self, collection: list, predicate: Callable[[Any], bool], message: str = "") -> bool:
         """Assert that all items in collection match predicate."""
-        passed = all(predicate(item) for item in collection)
-        result = AssertionResult(
-            passed=passed,
+        if all(predicate(item) for item in collection):
+            return True
+        if not self.soft_mode:
+            # The matched count re-runs the predicate; only soft mode keeps it
+            return False
+        return self._fail(
             expected="all items match predicate",
             actual=f"{sum(1 for i in collection if predicate(i))}/{len(collection)} matched",
             message=message or "Not all items matched the predicate",
-            assertion_type="all_match"
+            assertion_type=AssertionType.ALL_MATCH
         )
-        return self._handle_result(result)
 
     def any_match(self, collection: list, predicate: Callable[[Any], bool], message: str = "") -> bool:
         """Assert that at least one item in collection matches predicate."""
-        passed = any(predicate(item) for item in collection)
-        result = AssertionResult(
-            passed=passed,
+        if any(predicate(item) for item in collection):
+            return True
+        # any() only fails when nothing matched, so there is nothing to recount
+        return self._fail(
             expected="at least one item matches predicate",
-            actual=f"{sum(1 for i in collection if predicate(i))}/{len(collection)} matched",
+            actual=f"0/{len(collection)} matched",
             message=message or "No items matched the predicate",
-            assertion_type="any_match"
+            assertion_type=AssertionType.ANY_MATCH
         )
-        return self._handle_result(result)
 
     # ========== Type Assertions ==========
 
     def is_type(self, value: Any, expected_type: type, message: str = "") -> bool:
         """Assert that value is of expected type."""
-        passed = isinstance(value, expected_type)
-        result = AssertionResult(
-            passed=passed,
+        if isinstance(value, expected_type):
+            return True
+        return self._fail(
             expected=expected_type.__name__,
             actual=type(value).__name__,
             message=message or f"Expected type {expected_type.__name__}, got {type(value).__name__}",
-            assertion_type="is_type"
+            assertion_type=AssertionType.IS_TYPE
         )
-        return self._handle_result(result)
 
     # ========== URL Assertions ==========
 
     def is_valid_url(self, url: str, message: str = "") -> bool:
         """Assert that string is a valid URL."""
-        url_pattern = re.compile(
-            r'^https?://'
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
-            r'localhost|'
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-            r'(?::\d+)?'
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE
-        )
-        passed = bool(url_pattern.match(url))
-        result = AssertionResult(
-            passed=passed,
+        if _is_valid_url(url):
+            return True
+        return self._fail(
             expected="valid URL",
             actual=url,
             message=message or f"'{url}' is not a valid URL",
-            assertion_type="is_valid_url"
+            assertion_type=AssertionType.IS_VALID_URL
         )
-        return self._handle_result(result)
 
     def url_contains_path(self, url: str, path: str, message: str = "") -> bool:
         """Assert that URL contains specified path."""
-        passed = path in url
-        result = AssertionResult(
-            passed=passed,
+        if path in url:
+            return True
+        return self._fail(
             expected=f"URL contains path '{path}'",
             actual=url,
             message=message or f"URL does not contain path '{path}'",
-            assertion_type="url_contains_path"
+            assertion_type=AssertionType.URL_CONTAINS_PATH
         )
-        return self._handle_result(result)
 
     # ========== HTML/DOM Assertions ==========
 
     def html_contains_tag(self, html: str, tag: str, message: str = "") -> bool:
         """Assert that HTML contains specified tag."""
-        pattern = f"<{tag}[^>]*>"
-        passed = bool(re.search(pattern, html, re.IGNORECASE))
-        result = AssertionResult(
-            passed=passed,
+        if _TAG_NAME_RE.fullmatch(tag):
+            passed = _has_open_tag(html, tag)
+        else:
+            passed = _tag_re(tag).search(html) is not None
+        if passed:
+            return True
+        return self._fail(
             expected=f"contains <{tag}> tag",
             actual=f"HTML ({len(html)} chars)",
             message=message or f"HTML does not contain <{tag}> tag",
-            assertion_type="html_contains_tag"
+            assertion_type=AssertionType.HTML_CONTAINS_TAG
         )
-        return self._handle_result(result)
 
     def html_contains_text(self, html: str, text: str, message: str = "") -> bool:
         """Assert that HTML contains specified text."""
-        # Remove HTML tags for text comparison
-        clean_text = re.sub(r'<[^>]+>', '', html)
-        passed = text in clean_text
-        result = AssertionResult(
-            passed=passed,
+        if _text_outside_tags(html, text):
+            return True
+        # Text may still span markup ("Hello <b>World</b>"); compare with tags removed
+        clean_text = _STRIP_TAGS_RE.sub('', html)
+        if text in clean_text:
+            return True
+        return self._fail(
             expected=f"contains text '{text}'",
             actual=f"HTML content",
             message=message or f"HTML does not contain text '{text}'",
-            assertion_type="html_contains_text"
+            assertion_type=AssertionType.HTML_CONTAINS_TEXT
         )
-        return self._handle_result(result)
 
-    def has_attribute(self, html: str, tag: str, attribute: str, value: str = None, message: str = "") -> bool:
+    def has_attribute(self, html: str, tag: str, attribute: str, value: str | None = None, message: str = "") -> bool:
         """Assert that HTML tag has specified attribute."""
-        if value:
-            pattern = f'<{tag}[^>]*{attribute}=["\']?{re.escape(value)}["\']?[^>]*>'
-        else:
-            pattern = f'<{tag}[^>]*{attribute}[^>]*>'
-
-        passed = bool(re.search(pattern, html, re.IGNORECASE))
+        if _attr_re(tag, attribute, value or None).search(html):
+            return True
         expected = f"<{tag}> with {attribute}" + (f"='{value}'" if value else "")
-        result = AssertionResult(
-            passed=passed,
+        return self._fail(
             expected=expected,
             actual=f"HTML ({len(html)} chars)",
             message=message or f"HTML does not have {expected}",
-            assertion_type="has_attribute"
+            assertion_type=AssertionType.HAS_ATTRIBUTE
         )
-        return self._handle_result(result)
 
 
 # ========== Fluent Assertion Builder ==========
@@ -426,9 +557,9 @@ class Assertions:
 class ExpectChain:
     """Fluent assertion chain for more readable tests."""
 
-    def __init__(self, value: Any, assertions: Assertions = None):
+    def __init__(self, value: Any, assertions: Assertions | None = None):
         self.value = value
-        self.assertions = assertions or Assertions()
+        self.assertions = assertions or _default_assertions
 
     def to_equal(self, expected: Any) -> "ExpectChain":
         """Assert equality."""
@@ -450,7 +581,7 @@ class ExpectChain:
         self.assertions.is_false(self.value)
         return self
 
-    def to_match(self, pattern: str) -> "ExpectChain":
+    def to_match(self, pattern: str | re.Pattern) -> "ExpectChain":
         """Assert regex match."""
         self.assertions.matches_regex(self.value, pattern)
         return self
@@ -461,6 +592,21 @@ class ExpectChain:
         return self
 
 
-def expect(value: Any) -> ExpectChain:
+# Shared by expect() chains so they don't each allocate an Assertions and so
+# soft-mode failures from every chain land in one place
+_default_assertions = Assertions()
+
+
+def expect(value: Any, assertions: Assertions | None = None) -> ExpectChain:
     """Start a fluent assertion chain."""
-    return ExpectChain(value)
+    return ExpectChain(value, assertions)
+
+
+def _configure_expect(assertions: Assertions | None = None) -> Assertions:
+    """Replace the Assertions used by expect(); pass None for a fresh one."""
+    global _default_assertions
+    _default_assertions = assertions or Assertions()
+    return _default_assertions
+
+
+expect.configure = _configure_expect
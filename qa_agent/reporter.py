@@ -5,94 +5,94 @@ ZARAH - Test Report Generator
 Generates comprehensive test reports in multiple formats.
 """
 
-import json
-import os
+import gzip
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from .scenarios import TestSuite, TestResult, StepResult
 
 
-class TestReporter:
-    """
-    Generates test reports in various formats.
-
-    Supports HTML, JSON, and console output.
-    """
-
-    def __init__(self, output_dir: str = "./qa_reports"):
-        self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
-
-    def generate_report(
-        self,
-        suite: TestSuite,
-        results: list[TestResult],
-        format: str = "all"
-    ) -> str:
-        """Generate test report in specified format(s)."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_name = f"{suite.name.replace(' ', '_')}_{timestamp}"
-
-        paths = []
-
-        if format in ("all", "html"):
-            html_path = self._generate_html_report(suite, results, base_name)
-            paths.append(html_path)
-
-        if format in ("all", "json"):
-            json_path = self._generate_json_report(suite, results, base_name)
-            paths.append(json_path)
-
-        if format in ("all", "console"):
-            self._print_console_report(suite, results)
-
-        return paths[0] if paths else ""
-
-    def _calculate_stats(self, results: list[TestResult]) -> dict:
-        """Calculate test statistics."""
-        total_scenarios = len(results)
-        passed_scenarios = len([r for r in results if r.status == "passed"])
-        failed_scenarios = len([r for r in results if r.status == "failed"])
-        error_scenarios = len([r for r in results if r.status == "error"])
-
-        total_steps = sum(r.total_steps for r in results)
-        passed_steps = sum(r.passed_steps for r in results)
-        failed_steps = sum(r.failed_steps for r in results)
-
-        total_duration = sum(r.duration for r in results)
-
-        pass_rate = (passed_scenarios / total_scenarios * 100) if total_scenarios > 0 else 0
-
-        return {
-            "total_scenarios": total_scenarios,
-            "passed_scenarios": passed_scenarios,
-            "failed_scenarios": failed_scenarios,
-            "error_scenarios": error_scenarios,
-            "total_steps": total_steps,
-            "passed_steps": passed_steps,
-            "failed_steps": failed_steps,
-            "total_duration": total_duration,
-            "pass_rate": pass_rate,
-        }
-
-    def _generate_html_report(
-        self,
-        suite: TestSuite,
-        results: list[TestResult],
-        base_name: str
-    ) -> str:
-        """Generate HTML test report."""
-        stats = self._calculate_stats(results)
-
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ZARAH Test Report - {suite.name}</title>
-    <style>
-        :root {{
+def _to_json(obj):
+    """Fallback hook: suites and results serialize through their to_dict()."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+try:
+    import orjson
+
+    def _dump_json(obj) -> bytes:
+        """Serialize a report to indented UTF-8 JSON (datetimes as ISO 8601)."""
+        # Passthrough makes orjson call _to_json for dataclasses instead of
+        # dumping their raw fields
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS, default=_to_json
+        )
+
+    def _dump_json_line(obj) -> bytes:
+        """Serialize one object to a compact, newline-terminated JSON line."""
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_PASSTHROUGH_DATACLASS,
+            default=_to_json,
+        )
+except ImportError:
+    import json
+
+    def _dump_json(obj) -> bytes:
+        """Serialize a report to indented UTF-8 JSON (datetimes as ISO 8601)."""
+        return json.dumps(obj, indent=2, default=_to_json).encode()
+
+    def _dump_json_line(obj) -> bytes:
+        """Serialize one object to a compact, newline-terminated JSON line."""
+        return (json.dumps(obj, default=_to_json) + "\n").encode()
+
+
+try:
+    import msgspec
+except ImportError:  # Optional; only needed for MessagePack reports
+    msgspec = None
+
+
+# Report files are written through a 1 MiB buffer so the many small HTML
+# pieces reach the OS in a few large writes
+_WRITE_BUFFER = 1 << 20
+
+# Suites with at least this many results get gzip-compressed report files;
+# level 1 costs little CPU and still shrinks the repetitive HTML/JSON a lot
+_GZIP_MIN_RESULTS = 100
+_GZIP_LEVEL = 1
+
+# Escapes text interpolated into the HTML report in a single C-level pass
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+# Per-status icon, scenario badge and step CSS class; other statuses fall
+# back to "!" and formatted markup
+_STATUS_ICONS = {"passed": "✓", "failed": "✗"}
+_BADGE_HTML = {
+    status: f'<span class="status-badge status-{status}">{status}</span>'
+    for status in ("passed", "failed", "error", "pending")
+}
+_STEP_CLASSES = {status: f"step-{status}" for status in ("passed", "failed", "error", "pending")}
+
+# Ring circumference in the pass-rate chart; matches stroke-dasharray in _HTML_HEAD
+_RING_LENGTH = 327
+
+# Stylesheet for the HTML report, inlined into its <head>
+_RAW_CSS = """        :root {
             --primary: #6366f1;
             --success: #22c55e;
             --error: #ef4444;
@@ -102,203 +102,203 @@ class TestReporter:
             --text: #e2e8f0;
             --text-muted: #94a3b8;
             --border: #334155;
-        }}
+        }
 
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Segoe UI', system-ui, -apple-system, sans-serif;
             background: var(--bg);
             color: var(--text);
             line-height: 1.6;
             padding: 2rem;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
-        }}
+        }
 
-        header {{
+        header {
             text-align: center;
             margin-bottom: 3rem;
             padding: 2rem;
             background: linear-gradient(135deg, var(--bg-card), var(--bg));
             border-radius: 1rem;
             border: 1px solid var(--border);
-        }}
+        }
 
-        .logo {{
+        .logo {
             font-size: 3rem;
             font-weight: bold;
             background: linear-gradient(135deg, var(--primary), #a855f7);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .subtitle {{
+        .subtitle {
             color: var(--text-muted);
             font-size: 1.1rem;
-        }}
+        }
 
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 1.5rem;
             margin-bottom: 3rem;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: var(--bg-card);
             border-radius: 1rem;
             padding: 1.5rem;
             text-align: center;
             border: 1px solid var(--border);
             transition: transform 0.2s, box-shadow 0.2s;
-        }}
+        }
 
-        .stat-card:hover {{
+        .stat-card:hover {
             transform: translateY(-2px);
             box-shadow: 0 10px 40px rgba(0,0,0,0.3);
-        }}
+        }
 
-        .stat-value {{
+        .stat-value {
             font-size: 2.5rem;
             font-weight: bold;
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .stat-label {{
+        .stat-label {
             color: var(--text-muted);
             font-size: 0.9rem;
             text-transform: uppercase;
             letter-spacing: 0.05em;
-        }}
+        }
 
-        .stat-success {{ color: var(--success); }}
-        .stat-error {{ color: var(--error); }}
-        .stat-warning {{ color: var(--warning); }}
-        .stat-primary {{ color: var(--primary); }}
+        .stat-success { color: var(--success); }
+        .stat-error { color: var(--error); }
+        .stat-warning { color: var(--warning); }
+        .stat-primary { color: var(--primary); }
 
-        .progress-ring {{
+        .progress-ring {
             width: 120px;
             height: 120px;
             margin: 0 auto 1rem;
-        }}
+        }
 
-        .progress-ring circle {{
+        .progress-ring circle {
             fill: none;
             stroke-width: 8;
-        }}
+        }
 
-        .progress-ring .bg {{
+        .progress-ring .bg {
             stroke: var(--border);
-        }}
+        }
 
-        .progress-ring .progress {{
+        .progress-ring .progress {
             stroke: var(--success);
             stroke-linecap: round;
             transform: rotate(-90deg);
             transform-origin: 50% 50%;
             transition: stroke-dashoffset 0.5s;
-        }}
+        }
 
-        .progress-text {{
+        .progress-text {
             font-size: 1.5rem;
             font-weight: bold;
-        }}
+        }
 
-        .section {{
+        .section {
             margin-bottom: 2rem;
-        }}
+        }
 
-        .section-title {{
+        .section-title {
             font-size: 1.5rem;
             margin-bottom: 1.5rem;
             padding-bottom: 0.5rem;
             border-bottom: 2px solid var(--border);
-        }}
+        }
 
-        .scenario {{
+        .scenario {
             background: var(--bg-card);
             border-radius: 1rem;
             margin-bottom: 1.5rem;
             border: 1px solid var(--border);
             overflow: hidden;
-        }}
+        }
 
-        .scenario-header {{
+        .scenario-header {
             padding: 1.5rem;
             display: flex;
             justify-content: space-between;
             align-items: center;
             cursor: pointer;
             transition: background 0.2s;
-        }}
+        }
 
-        .scenario-header:hover {{
+        .scenario-header:hover {
             background: rgba(255,255,255,0.02);
-        }}
+        }
 
-        .scenario-name {{
+        .scenario-name {
             font-size: 1.2rem;
             font-weight: 600;
-        }}
+        }
 
-        .scenario-meta {{
+        .scenario-meta {
             display: flex;
             gap: 1rem;
             color: var(--text-muted);
             font-size: 0.9rem;
-        }}
+        }
 
-        .status-badge {{
+        .status-badge {
             padding: 0.25rem 0.75rem;
             border-radius: 9999px;
             font-size: 0.8rem;
             font-weight: 600;
             text-transform: uppercase;
-        }}
+        }
 
-        .status-passed {{
+        .status-passed {
             background: rgba(34, 197, 94, 0.2);
             color: var(--success);
-        }}
+        }
 
-        .status-failed {{
+        .status-failed {
             background: rgba(239, 68, 68, 0.2);
             color: var(--error);
-        }}
+        }
 
-        .status-error {{
+        .status-error {
             background: rgba(245, 158, 11, 0.2);
             color: var(--warning);
-        }}
+        }
 
-        .scenario-details {{
+        .scenario-details {
             padding: 0 1.5rem 1.5rem;
             display: none;
-        }}
+        }
 
-        .scenario.expanded .scenario-details {{
+        .scenario.expanded .scenario-details {
             display: block;
-        }}
+        }
 
-        .step {{
+        .step {
             display: flex;
             align-items: center;
             padding: 0.75rem;
             border-radius: 0.5rem;
             margin-bottom: 0.5rem;
             background: rgba(0,0,0,0.2);
-        }}
+        }
 
-        .step-icon {{
+        .step-icon {
             width: 24px;
             height: 24px;
             border-radius: 50%;
@@ -307,78 +307,93 @@ class TestReporter:
             justify-content: center;
             margin-right: 1rem;
             font-size: 0.8rem;
-        }}
+        }
 
-        .step-passed .step-icon {{
+        .step-passed .step-icon {
             background: var(--success);
             color: white;
-        }}
+        }
 
-        .step-failed .step-icon {{
+        .step-failed .step-icon {
             background: var(--error);
             color: white;
-        }}
+        }
 
-        .step-error .step-icon {{
+        .step-error .step-icon {
             background: var(--warning);
             color: white;
-        }}
+        }
 
-        .step-info {{
+        .step-info {
             flex: 1;
-        }}
+        }
 
-        .step-name {{
+        .step-name {
             font-weight: 500;
-        }}
+        }
 
-        .step-action {{
+        .step-action {
             color: var(--text-muted);
             font-size: 0.85rem;
-        }}
+        }
 
-        .step-duration {{
+        .step-duration {
             color: var(--text-muted);
             font-size: 0.85rem;
-        }}
+        }
 
-        .step-message {{
+        .step-message {
             color: var(--error);
             font-size: 0.85rem;
             margin-top: 0.25rem;
-        }}
+        }
 
-        footer {{
+        footer {
             text-align: center;
             padding: 2rem;
             color: var(--text-muted);
             font-size: 0.9rem;
-        }}
+        }
 
-        .expand-icon {{
+        .expand-icon {
             transition: transform 0.2s;
-        }}
+        }
 
-        .scenario.expanded .expand-icon {{
+        .scenario.expanded .expand-icon {
             transform: rotate(180deg);
-        }}
+        }
 
-        @media (max-width: 768px) {{
-            body {{
+        @media (max-width: 768px) {
+            body {
                 padding: 1rem;
-            }}
+            }
 
-            .stats-grid {{
+            .stats-grid {
                 grid-template-columns: repeat(2, 1fr);
-            }}
+            }
 
-            .scenario-header {{
+            .scenario-header {
                 flex-direction: column;
                 align-items: flex-start;
                 gap: 0.5rem;
-            }}
-        }}
-    </style>
+            }
+        }
+"""
+
+# Minified once at import: whitespace runs collapse and disappear around
+# punctuation, roughly halving the stylesheet bytes in every report
+_CSS = re.sub(r"\s+", " ", _RAW_CSS)
+_CSS = "        " + re.sub(r"\s*([{};:,])\s*", r"\1", _CSS).strip() + "\n"
+
+# Start of the HTML report up to the scenario list; filled with format_map
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>ZARAH Test Report - {suite_name}</title>
+    <style>
+{css}    </style>
 </head>
 <body>
     <div class="container">
@@ -386,8 +401,8 @@ class TestReporter:
             <div class="logo">ZARAH</div>
             <div class="subtitle">Expert Browser QA Testing Agent - Test Report</div>
             <p style="margin-top: 1rem; color: var(--text-muted);">
-                Suite: <strong>{suite.name}</strong> |
-                Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+                Suite: <strong>{suite_name}</strong> |
+                Generated: {generated_at}
             </p>
         </header>
 
@@ -397,41 +412,44 @@ class TestReporter:
                     <circle class="bg" cx="60" cy="60" r="52"/>
                     <circle class="progress" cx="60" cy="60" r="52"
                         stroke-dasharray="327"
-                        stroke-dashoffset="{327 - (327 * stats['pass_rate'] / 100)}"/>
+                        stroke-dashoffset="{dashoffset}"/>
                 </svg>
-                <div class="progress-text stat-success">{stats['pass_rate']:.1f}%</div>
+                <div class="progress-text stat-success">{pass_rate:.1f}%</div>
                 <div class="stat-label">Pass Rate</div>
             </div>
 
             <div class="stat-card">
-                <div class="stat-value stat-primary">{stats['total_scenarios']}</div>
+                <div class="stat-value stat-primary">{total_scenarios}</div>
                 <div class="stat-label">Total Scenarios</div>
             </div>
 
             <div class="stat-card">
-                <div class="stat-value stat-success">{stats['passed_scenarios']}</div>
+                <div class="stat-value stat-success">{passed_scenarios}</div>
                 <div class="stat-label">Passed</div>
             </div>
 
             <div class="stat-card">
-                <div class="stat-value stat-error">{stats['failed_scenarios']}</div>
+                <div class="stat-value stat-error">{failed_scenarios}</div>
                 <div class="stat-label">Failed</div>
             </div>
 
             <div class="stat-card">
-                <div class="stat-value stat-primary">{stats['total_steps']}</div>
+                <div class="stat-value stat-primary">{total_steps}</div>
                 <div class="stat-label">Total Steps</div>
             </div>
 
             <div class="stat-card">
-                <div class="stat-value stat-warning">{stats['total_duration']:.1f}s</div>
+                <div class="stat-value stat-warning">{total_duration:.1f}s</div>
                 <div class="stat-label">Duration</div>
             </div>
         </div>
 
         <div class="section">
             <h2 class="section-title">Test Results</h2>
-            {self._generate_scenarios_html(results)}
+            """
+
+# Static end of the HTML report, after the scenario list
+_HTML_TAIL = """
         </div>
 
         <footer>
@@ -441,72 +459,216 @@ class TestReporter:
     </div>
 
     <script>
-        document.querySelectorAll('.scenario-header').forEach(header => {{
-            header.addEventListener('click', () => {{
+        document.querySelectorAll('.scenario-header').forEach(header => {
+            header.addEventListener('click', () => {
                 header.parentElement.classList.toggle('expanded');
-            }});
-        }});
+            });
+        });
     </script>
 </body>
 </html>"""
 
-        filepath = os.path.join(self.output_dir, f"{base_name}.html")
-        with open(filepath, "w") as f:
-            f.write(html)
 
-        return filepath
+class TestReporter:
+    """
+    Generates test reports in various formats.
 
-    def _generate_scenarios_html(self, results: list[TestResult]) -> str:
-        """Generate HTML for scenario results."""
-        html_parts = []
+    Supports HTML, JSON, JSON Lines, MessagePack and console output.
+    """
 
-        for result in results:
-            status_class = f"status-{result.status}"
+    def __init__(self, output_dir: str = "./qa_reports"):
+        self.output_dir = output_dir
+        # Created once; report paths are built from this Path afterwards
+        self._out = Path(output_dir)
+        self._out.mkdir(parents=True, exist_ok=True)
+
+    def generate_report(
+        self,
+        suite: TestSuite,
+        results: list[TestResult],
+        format: str = "all"
+    ) -> str:
+        """
+        Generate test report in specified format(s).
+
+        format is one of "all", "html", "json", "ndjson", "msgpack" or
+        "console"; "msgpack" needs msgspec installed.
+
+        "all" writes the .html report, the streamed .ndjson (JSON Lines)
+        report and the console summary. It used to write a single .json
+        document instead of the .ndjson one; pass format="json" for that.
+        """
+        html = format in ("all", "html")
+        json_ = format == "json"
+        ndjson = format in ("all", "ndjson")
+        msgpack = format == "msgpack"
+        console = format in ("all", "console")
+        if not (html or json_ or ndjson or msgpack or console):
+            return ""
+        if msgpack and msgspec is None:
+            raise ImportError("MessagePack reports require msgspec (pip install msgspec)")
+
+        # One clock read per report, shared by the file name and every format
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        generated = now.strftime("%Y-%m-%d %H:%M:%S")
+        base_name = f"{suite.name.replace(' ', '_')}_{timestamp}"
+
+        # Shared by every format below
+        stats = self._calculate_stats(results)
+
+        if not (html or json_ or ndjson or msgpack):
+            self._print_console_report(suite, results, stats, generated)
+            return ""
+
+        # Report files are independent, so they are written on worker threads
+        # while the console report prints on this one
+        jobs = []
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            if html:
+                jobs.append(pool.submit(self._generate_html_report, suite, results, base_name, stats, generated))
+
+            if json_:
+                jobs.append(pool.submit(self._generate_json_report, suite, results, base_name, stats, now))
+
+            if ndjson:
+                jobs.append(pool.submit(self._generate_ndjson_report, suite, results, base_name, stats, now))
+
+            if msgpack:
+                jobs.append(pool.submit(self._generate_msgpack_report, suite, results, base_name, stats, now))
+
+            if console:
+                self._print_console_report(suite, results, stats, generated)
+
+            paths = [job.result() for job in jobs]
+
+        return paths[0] if paths else ""
+
+    def _report_path(self, base_name: str, ext: str, results: list[TestResult]) -> Path:
+        """Path of a report file, with a .gz suffix for large suites."""
+        if len(results) >= _GZIP_MIN_RESULTS:
+            ext += ".gz"
+        return self._out / (base_name + ext)
+
+    def _open_report(self, filepath: Path, text: bool = False):
+        """Open a report file for writing, compressing it if it ends in .gz."""
+        if filepath.suffix == ".gz":
+            if text:
+                return gzip.open(filepath, "wt", compresslevel=_GZIP_LEVEL, encoding="utf-8")
+            return gzip.open(filepath, "wb", compresslevel=_GZIP_LEVEL)
+        if text:
+            return open(filepath, "w", encoding="utf-8", buffering=_WRITE_BUFFER)
+        return open(filepath, "wb", buffering=_WRITE_BUFFER)
+
+    def _calculate_stats(self, results: list[TestResult]) -> dict:
+        """Calculate test statistics in a single pass over the results."""
+        total_scenarios = len(results)
+        passed_scenarios = failed_scenarios = error_scenarios = 0
+        total_steps = passed_steps = failed_steps = 0
+        total_duration = 0.0
+
+        for r in results:
+            status = r.status
+            if status == "passed":
+                passed_scenarios += 1
+            elif status == "failed":
+                failed_scenarios += 1
+            elif status == "error":
+                error_scenarios += 1
+            total_steps += r.total_steps
+            passed_steps += r.passed_steps
+            failed_steps += r.failed_steps
+            total_duration += r.duration
+
+        pass_rate = (passed_scenarios / total_scenarios * 100) if total_scenarios > 0 else 0
+
+        return {
+            "total_scenarios": total_scenarios,
+            "passed_scenarios": passed_scenarios,
+            "failed_scenarios": failed_scenarios,
+            "error_scenarios": error_scenarios,
+            "total_steps": total_steps,
+            "passed_steps": passed_steps,
+            "failed_steps": failed_steps,
+            "total_duration": total_duration,
+            "pass_rate": pass_rate,
+        }
+
+    def _generate_html_report(
+        self,
+        suite: TestSuite,
+        results: list[TestResult],
+        base_name: str,
+        stats: dict,
+        generated: str
+    ) -> str:
+        """Generate HTML test report."""
+        head = _HTML_HEAD.format_map({
+            **stats,
+            "css": _CSS,
+            "suite_name": suite.name.translate(_HTML_ESCAPE),
+            "generated_at": generated,
+            "dashoffset": _RING_LENGTH - (_RING_LENGTH * stats["pass_rate"] / 100),
+        })
+
+        filepath = self._report_path(base_name, ".html", results)
+        with self._open_report(filepath, text=True) as f:
+            # Written piece by piece so the full page is never one string
+            f.write(head)
+            f.writelines(self._iter_scenarios_html(results))
+            f.write(_HTML_TAIL)
+
+        return str(filepath)
+
+    def _iter_scenarios_html(self, results: list[TestResult]):
+        """Yield the HTML for each scenario result, newline-separated."""
+        for i, result in enumerate(results):
+            if i:
+                yield "\n"
+            badge = _BADGE_HTML.get(result.status) or f'<span class="status-badge status-{result.status}">{result.status}</span>'
             steps_html = self._generate_steps_html(result.step_results)
 
-            html_parts.append(f"""
+            yield f"""
             <div class="scenario">
                 <div class="scenario-header">
                     <div>
-                        <div class="scenario-name">{result.scenario.name}</div>
+                        <div class="scenario-name">{result.scenario.name.translate(_HTML_ESCAPE)}</div>
                         <div class="scenario-meta">
                             <span>{result.total_steps} steps</span>
                             <span>{result.duration:.2f}s</span>
                         </div>
                     </div>
                     <div style="display: flex; align-items: center; gap: 1rem;">
-                        <span class="status-badge {status_class}">{result.status}</span>
+                        {badge}
                         <span class="expand-icon">▼</span>
                     </div>
                 </div>
                 <div class="scenario-details">
                     <p style="color: var(--text-muted); margin-bottom: 1rem;">
-                        {result.scenario.description}
+                        {result.scenario.description.translate(_HTML_ESCAPE)}
                     </p>
                     {steps_html}
                 </div>
-            </div>""")
-
-        return "\n".join(html_parts)
+            </div>"""
 
     def _generate_steps_html(self, step_results: list[StepResult]) -> str:
         """Generate HTML for step results."""
         html_parts = []
 
         for sr in step_results:
-            icon = "✓" if sr.status == "passed" else "✗" if sr.status == "failed" else "!"
-            step_class = f"step-{sr.status}"
+            icon = _STATUS_ICONS.get(sr.status, "!")
+            step_class = _STEP_CLASSES.get(sr.status) or f"step-{sr.status}"
 
             message_html = ""
             if sr.message:
-                message_html = f'<div class="step-message">{sr.message}</div>'
+                message_html = f'<div class="step-message">{sr.message.translate(_HTML_ESCAPE)}</div>'
 
             html_parts.append(f"""
             <div class="step {step_class}">
                 <div class="step-icon">{icon}</div>
                 <div class="step-info">
-                    <div class="step-name">{sr.step.name}</div>
-                    <div class="step-action">{sr.step.action}: {sr.step.target or ''}</div>
+                    <div class="step-name">{sr.step.name.translate(_HTML_ESCAPE)}</div>
+                    <div class="step-action">{sr.step.action.translate(_HTML_ESCAPE)}: {(sr.step.target or '').translate(_HTML_ESCAPE)}</div>
                     {message_html}
                 </div>
                 <div class="step-duration">{sr.duration:.2f}s</div>
@@ -518,62 +680,125 @@ class TestReporter:
         self,
         suite: TestSuite,
         results: list[TestResult],
-        base_name: str
+        base_name: str,
+        stats: dict,
+        generated_at: datetime
     ) -> str:
         """Generate JSON test report."""
-        stats = self._calculate_stats(results)
+        report = {
+            "suite": suite,
+            "generated_at": generated_at,
+            "statistics": stats,
+            "results": results,
+        }
 
+        filepath = self._report_path(base_name, ".json", results)
+        data = _dump_json(report)
+        if filepath.suffix == ".gz":
+            data = gzip.compress(data, compresslevel=_GZIP_LEVEL)
+        filepath.write_bytes(data)
+
+        return str(filepath)
+
+    def _generate_ndjson_report(
+        self,
+        suite: TestSuite,
+        results: list[TestResult],
+        base_name: str,
+        stats: dict,
+        generated_at: datetime
+    ) -> str:
+        """
+        Generate a JSON Lines test report.
+
+        The first line holds the suite, timestamp and statistics; each
+        following line is one result, serialized and written as it is reached
+        so memory stays flat however large the suite is.
+        """
+        header = {
+            "suite": suite,
+            "generated_at": generated_at,
+            "statistics": stats,
+        }
+
+        filepath = self._report_path(base_name, ".ndjson", results)
+        with self._open_report(filepath) as f:
+            f.write(_dump_json_line(header))
+            for result in results:
+                f.write(_dump_json_line(result))
+
+        return str(filepath)
+
+    def _generate_msgpack_report(
+        self,
+        suite: TestSuite,
+        results: list[TestResult],
+        base_name: str,
+        stats: dict,
+        generated_at: datetime
+    ) -> str:
+        """Generate a MessagePack test report with the same layout as the JSON one."""
         report = {
             "suite": suite.to_dict(),
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": generated_at,
             "statistics": stats,
             "results": [r.to_dict() for r in results],
         }
 
-        filepath = os.path.join(self.output_dir, f"{base_name}.json")
-        with open(filepath, "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        filepath = self._report_path(base_name, ".msgpack", results)
+        data = msgspec.msgpack.encode(report)
+        if filepath.suffix == ".gz":
+            data = gzip.compress(data, compresslevel=_GZIP_LEVEL)
+        filepath.write_bytes(data)
 
-        return filepath
+        return str(filepath)
 
-    def _print_console_report(self, suite: TestSuite, results: list[TestResult]):
+    def _print_console_report(self, suite: TestSuite, results: list[TestResult], stats: dict, generated: str):
         """Print test report to console."""
-        stats = self._calculate_stats(results)
-
-        print("\n" + "=" * 70)
-        print("  ZARAH - Test Report")
-        print("=" * 70)
-        print(f"\n  Suite: {suite.name}")
-        print(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
-        print("\n" + "-" * 70)
-        print("  SUMMARY")
-        print("-" * 70)
-        print(f"  Total Scenarios:  {stats['total_scenarios']}")
-        print(f"  Passed:           {stats['passed_scenarios']} ✓")
-        print(f"  Failed:           {stats['failed_scenarios']} ✗")
-        print(f"  Errors:           {stats['error_scenarios']} !")
-        print(f"  Pass Rate:        {stats['pass_rate']:.1f}%")
-        print(f"  Total Duration:   {stats['total_duration']:.2f}s")
-
-        print("\n" + "-" * 70)
-        print("  RESULTS")
-        print("-" * 70)
+        lines: list[str] = []
+        out = lines.append
+
+        out("\n" + "=" * 70)
+        out("  ZARAH - Test Report")
+        out("=" * 70)
+        out(f"\n  Suite: {suite.name}")
+        out(f"  Generated: {generated}")
+
+        out("\n" + "-" * 70)
+        out("  SUMMARY")
+        out("-" * 70)
+        out(f"  Total Scenarios:  {stats['total_scenarios']}")
+        out(f"  Passed:           {stats['passed_scenarios']} ✓")
+        out(f"  Failed:           {stats['failed_scenarios']} ✗")
+        out(f"  Errors:           {stats['error_scenarios']} !")
+        out(f"  Pass Rate:        {stats['pass_rate']:.1f}%")
+        out(f"  Total Duration:   {stats['total_duration']:.2f}s")
+
+        out("\n" + "-" * 70)
+        out("  RESULTS")
+        out("-" * 70)
 
         for result in results:
-            icon = "✓" if result.status == "passed" else "✗" if result.status == "failed" else "!"
-            print(f"\n  {icon} {result.scenario.name}")
-            print(f"    Status: {result.status.upper()}")
-            print(f"    Steps: {result.passed_steps}/{result.total_steps} passed")
-            print(f"    Duration: {result.duration:.2f}s")
-
-            # Show failed steps
-            failed = [sr for sr in result.step_results if sr.status != "passed"]
-            if failed:
-                print("    Failed Steps:")
-                for sr in failed[:3]:  # Show max 3 failures
-                    print(f"      - {sr.step.name}: {sr.message or sr.status}")
-
-        print("\n" + "=" * 70)
-        print("  Report generated by ZARAH - Expert Browser QA Testing Agent")
-        print("=" * 70 + "\n")
+            icon = _STATUS_ICONS.get(result.status, "!")
+            out(f"\n  {icon} {result.scenario.name}")
+            out(f"    Status: {result.status.upper()}")
+            out(f"    Steps: {result.passed_steps}/{result.total_steps} passed")
+            out(f"    Duration: {result.duration:.2f}s")
+
+            # Show failed steps, stopping at the third
+            shown = 0
+            for sr in result.step_results:
+                if sr.status == "passed":
+                    continue
+                if not shown:
+                    out("    Failed Steps:")
+                out(f"      - {sr.step.name}: {sr.message or sr.status}")
+                shown += 1
+                if shown >= 3:  # Show max 3 failures
+                    break
+
+        out("\n" + "=" * 70)
+        out("  Report generated by ZARAH - Expert Browser QA Testing Agent")
+        out("=" * 70 + "\n")
+
+        sys.stdout.write("\n".join(lines) + "\n")
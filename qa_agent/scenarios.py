@@ -10,6 +10,11 @@ from datetime import datetime
 from typing import Any
 from enum import Enum
 
+try:
+    import msgspec
+except ImportError:  # Optional; scenario files load through json + from_dict
+    msgspec = None
+
 
 class ActionType(str, Enum):
     """Available test actions."""
@@ -41,7 +46,19 @@ class StepStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+# Plain-str status values for the hot counting paths. Status fields stay str
+# so they format as "passed" rather than "StepStatus.PASSED" in reports/logs
+_PENDING = StepStatus.PENDING.value
+_PASSED = StepStatus.PASSED.value
+_FAILED = StepStatus.FAILED.value
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    """ISO 8601 text for an optional timestamp, read once."""
+    return None if value is None else value.isoformat()
+
+
+@dataclass(slots=True)
 class TestStep:
     """
     A single test step within a scenario.
@@ -86,12 +103,28 @@ class TestStep:
         """Create step from dictionary."""
         return cls(**data)
 
-
-@dataclass
+    @classmethod
+    def fast(cls, name: str, action: str, target: str = "") -> "TestStep":
+        """Build a step with only name/action/target set, skipping the generated __init__."""
+        step = object.__new__(cls)
+        step.name = name
+        step.action = action
+        step.target = target
+        step.value = None
+        step.timeout = None
+        step.critical = False
+        step.screenshot_on_failure = True
+        step.retry_count = 0
+        step.description = ""
+        step.expected = None
+        return step
+
+
+@dataclass(slots=True)
 class StepResult:
     """Result of executing a test step."""
     step: TestStep
-    status: str = "pending"
+    status: str = _PENDING
     message: str = ""
     screenshot: str = ""
     start_time: datetime = None
@@ -107,13 +140,13 @@ class StepResult:
             "status": self.status,
             "message": self.message,
             "screenshot": self.screenshot,
-            "start_time": self.start_time.isoformat() if self.start_time else None,
-            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "start_time": _isoformat(self.start_time),
+            "end_time": _isoformat(self.end_time),
             "duration": self.duration,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TestScenario:
     """
     A complete test scenario containing multiple steps.
@@ -154,6 +187,11 @@ class TestScenario:
         self.teardown_steps.append(step)
         return self
 
+    def add_tag(self, tag: str) -> "TestScenario":
+        """Add a tag."""
+        self.tags.append(tag)
+        return self
+
     def to_dict(self) -> dict:
         """Convert scenario to dictionary."""
         return {
@@ -177,29 +215,42 @@ class TestScenario:
             teardown_steps=[TestStep.from_dict(s) for s in data.get("teardown_steps", [])],
             tags=data.get("tags", []),
             priority=data.get("priority", 5),
+            timeout=data.get("timeout", 300000),
+            data=data.get("data", {}),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of executing a complete test scenario."""
     scenario: TestScenario
-    status: str = "pending"
+    status: str = _PENDING
     step_results: list[StepResult] = field(default_factory=list)
     start_time: datetime = None
     end_time: datetime = None
     duration: float = 0.0
     error_message: str = ""
 
+    def _counts(self) -> tuple[int, int]:
+        """Passed and failed step counts in a single pass."""
+        passed = failed = 0
+        for r in self.step_results:
+            status = r.status
+            if status == _PASSED:
+                passed += 1
+            elif status == _FAILED:
+                failed += 1
+        return passed, failed
+
     @property
     def passed_steps(self) -> int:
         """Count of passed steps."""
-        return len([r for r in self.step_results if r.status == "passed"])
+        return self._counts()[0]
 
     @property
     def failed_steps(self) -> int:
         """Count of failed steps."""
-        return len([r for r in self.step_results if r.status == "failed"])
+        return self._counts()[1]
 
     @property
     def total_steps(self) -> int:
@@ -208,20 +259,21 @@ class TestResult:
 
     def to_dict(self) -> dict:
         """Convert result to dictionary."""
+        passed, failed = self._counts()
         return {
             "scenario": self.scenario.to_dict(),
             "status": self.status,
             "step_results": [r.to_dict() for r in self.step_results],
-            "start_time": self.start_time.isoformat() if self.start_time else None,
-            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "start_time": _isoformat(self.start_time),
+            "end_time": _isoformat(self.end_time),
             "duration": self.duration,
-            "passed_steps": self.passed_steps,
-            "failed_steps": self.failed_steps,
-            "total_steps": self.total_steps,
+            "passed_steps": passed,
+            "failed_steps": failed,
+            "total_steps": len(self.step_results),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TestSuite:
     """
     A collection of test scenarios.
@@ -246,6 +298,61 @@ class TestSuite:
         self.scenarios.append(scenario)
         return self
 
+    def add_tag(self, tag: str) -> "TestSuite":
+        """Add a tag to the suite."""
+        self.tags.append(tag)
+        return self
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> "TestSuite":
+        """Create suite from a JSON suite file or single-scenario file."""
+        return cls._from_file(raw, "json")
+
+    @classmethod
+    def from_msgpack(cls, raw: bytes) -> "TestSuite":
+        """Create suite from a MessagePack suite file or single-scenario file."""
+        if msgspec is None:
+            raise ImportError("MessagePack scenario files require msgspec (pip install msgspec)")
+        return cls._from_file(raw, "msgpack")
+
+    @classmethod
+    def _from_file(cls, raw: bytes, fmt: str) -> "TestSuite":
+        """Decode a scenario file, typed when msgspec is available."""
+        if msgspec is not None:
+            try:
+                file = _FILE_DECODERS[fmt].decode(raw)
+            except msgspec.ValidationError:
+                # Loosely typed files (e.g. a numeric step value) and files
+                # with unknown keys go through the from_dict path below, so
+                # they load or fail exactly as they do without msgspec
+                pass
+            else:
+                if file.scenarios is not None:
+                    return cls(
+                        name=file.name if file.name is not None else "Test Suite",
+                        description=file.description,
+                        scenarios=[_scenario_from_spec(s) for s in file.scenarios],
+                    )
+                if file.name is not None:
+                    scenario = _scenario_from_spec(file)
+                    return cls(name=scenario.name, scenarios=[scenario])
+
+        data = _decode_json(raw) if fmt == "json" else msgspec.msgpack.decode(raw)
+        return cls._from_file_data(data)
+
+    @classmethod
+    def _from_file_data(cls, data: dict) -> "TestSuite":
+        """Build a suite from a decoded scenario file."""
+        # Support both single scenario and suite format
+        if "scenarios" in data:
+            return cls(
+                name=data.get("name", "Test Suite"),
+                description=data.get("description", ""),
+                scenarios=_build_scenarios(data["scenarios"]),
+            )
+        scenario = _build_scenarios([data])[0]
+        return cls(name=scenario.name, scenarios=[scenario])
+
     def filter_by_tag(self, tag: str) -> list[TestScenario]:
         """Get scenarios matching a tag."""
         return [s for s in self.scenarios if tag in s.tags]
@@ -260,6 +367,82 @@ class TestSuite:
         }
 
 
+def _build_scenarios(items: list[dict]) -> list[TestScenario]:
+    """Convert decoded scenario dicts to TestScenarios."""
+    return [TestScenario.from_dict(s) for s in items]
+
+
+if msgspec is not None:
+    _decode_json = msgspec.json.decode
+
+    # Typed decoders go straight from bytes to these structs, never building
+    # the intermediate dict tree for the whole file. Unknown keys are
+    # rejected so such files fall back to from_dict, which raises on them.
+    class _StepSpec(msgspec.Struct, forbid_unknown_fields=True):
+        """TestStep's fields, in TestStep's order."""
+        name: str
+        action: str
+        target: str = ""
+        value: str | None = None
+        timeout: int | None = None
+        critical: bool = False
+        screenshot_on_failure: bool = True
+        retry_count: int = 0
+        description: str = ""
+        expected: Any = None
+
+    class _ScenarioSpec(msgspec.Struct, forbid_unknown_fields=True):
+        """The fields TestScenario.from_dict reads."""
+        name: str
+        description: str = ""
+        steps: list[_StepSpec] = []
+        setup_steps: list[_StepSpec] = []
+        teardown_steps: list[_StepSpec] = []
+        tags: list[str] = []
+        priority: int = 5
+        timeout: int = 300000
+        data: dict = {}
+
+    class _ScenarioFile(msgspec.Struct, forbid_unknown_fields=True):
+        """Either scenario-file layout: a suite with scenarios, or one scenario's fields."""
+        name: str | None = None
+        description: str = ""
+        scenarios: list[_ScenarioSpec] | None = None
+        steps: list[_StepSpec] = []
+        setup_steps: list[_StepSpec] = []
+        teardown_steps: list[_StepSpec] = []
+        tags: list[str] = []
+        priority: int = 5
+        timeout: int = 300000
+        data: dict = {}
+
+    _astuple = msgspec.structs.astuple
+
+    def _scenario_from_spec(spec: "_ScenarioSpec | _ScenarioFile") -> TestScenario:
+        """Build a TestScenario from a decoded scenario struct."""
+        return TestScenario(
+            name=spec.name,
+            description=spec.description,
+            steps=[TestStep(*_astuple(s)) for s in spec.steps],
+            setup_steps=[TestStep(*_astuple(s)) for s in spec.setup_steps],
+            teardown_steps=[TestStep(*_astuple(s)) for s in spec.teardown_steps],
+            tags=spec.tags,
+            priority=spec.priority,
+            timeout=spec.timeout,
+            data=spec.data,
+        )
+
+    _FILE_DECODERS = {
+        "json": msgspec.json.Decoder(_ScenarioFile),
+        "msgpack": msgspec.msgpack.Decoder(_ScenarioFile),
+    }
+else:
+    try:
+        from orjson import loads as _decode_json
+    except ImportError:
+        from json import loads as _decode_json
+
+
 # ========== Pre-built Scenario Templates ==========
 
 class ScenarioTemplates:
@@ -281,14 +464,14 @@ class ScenarioTemplates:
             description=f"Test login functionality at {url}",
             tags=["login", "auth", "smoke"],
             steps=[
-                TestStep(name="Navigate to Login", action="navigate", target=url, critical=True),
-                TestStep(name="Enter Username", action="type", target=username_selector, value=username),
-                TestStep(name="Enter Password", action="type", target=password_selector, value=password),
-                TestStep(name="Screenshot Before Submit", action="screenshot", target="login_form"),
-                TestStep(name="Submit Login", action="click", target=submit_selector, critical=True),
-                TestStep(name="Wait for Response", action="wait", timeout=3000),
-                TestStep(name="Verify Login Success", action="assert_text", target=success_indicator),
-                TestStep(name="Screenshot After Login", action="screenshot", target="login_success"),
+                TestStep("Navigate to Login", "navigate", url, critical=True),
+                TestStep("Enter Username", "type", username_selector, username),
+                TestStep("Enter Password", "type", password_selector, password),
+                TestStep.fast("Screenshot Before Submit", "screenshot", "login_form"),
+                TestStep("Submit Login", "click", submit_selector, critical=True),
+                TestStep("Wait for Response", "wait", timeout=3000),
+                TestStep.fast("Verify Login Success", "assert_text", success_indicator),
+                TestStep.fast("Screenshot After Login", "screenshot", "login_success"),
             ]
         )
 
@@ -296,17 +479,15 @@ class ScenarioTemplates:
     def page_load_test(url: str, expected_elements: list[str] = None) -> TestScenario:
         """Create a page load test scenario."""
         steps = [
-            TestStep(name="Navigate", action="navigate", target=url, critical=True),
-            TestStep(name="Wait for Load", action="wait", timeout=2000),
-            TestStep(name="Screenshot", action="screenshot", target="page_load"),
+            TestStep("Navigate", "navigate", url, critical=True),
+            TestStep("Wait for Load", "wait", timeout=2000),
+            TestStep.fast("Screenshot", "screenshot", "page_load"),
+            *(
+                TestStep.fast(f"Verify Element {i}", "assert_element", element)
+                for i, element in enumerate(expected_elements or (), 1)
+            ),
         ]
 
-        if expected_elements:
-            for i, element in enumerate(expected_elements):
-                steps.append(
-                    TestStep(name=f"Verify Element {i+1}", action="assert_element", target=element)
-                )
-
         return TestScenario(
             name=f"Page Load: {url}",
             description=f"Verify {url} loads correctly",
@@ -323,20 +504,17 @@ class ScenarioTemplates:
     ) -> TestScenario:
         """Create a form validation test scenario."""
         steps = [
-            TestStep(name="Navigate", action="navigate", target=url, critical=True),
+            TestStep("Navigate", "navigate", url, critical=True),
+            # Test empty submission
+            TestStep.fast("Submit Empty Form", "click", submit_selector),
+            TestStep("Wait", "wait", timeout=1000),
+            *(
+                TestStep.fast(f"Check Error: {selector}", "assert_element", selector)
+                for selector in error_selectors
+            ),
+            TestStep.fast("Screenshot Validation Errors", "screenshot", "validation_errors"),
         ]
 
-        # Test empty submission
-        steps.append(TestStep(name="Submit Empty Form", action="click", target=submit_selector))
-        steps.append(TestStep(name="Wait", action="wait", timeout=1000))
-
-        for selector in error_selectors:
-            steps.append(
-                TestStep(name=f"Check Error: {selector}", action="assert_element", target=selector)
-            )
-
-        steps.append(TestStep(name="Screenshot Validation Errors", action="screenshot", target="validation_errors"))
-
         return TestScenario(
             name="Form Validation Test",
             description="Test form validation rules",
@@ -355,14 +533,13 @@ class ScenarioTemplates:
             ]
 
         steps = [
-            TestStep(name="Navigate", action="navigate", target=url, critical=True),
+            TestStep("Navigate", "navigate", url, critical=True),
+            *(
+                TestStep.fast(f"Screenshot {vp['name']}", "screenshot", f"responsive_{vp['name']}")
+                for vp in viewports
+            ),
         ]
 
-        for vp in viewports:
-            steps.extend([
-                TestStep(name=f"Screenshot {vp['name']}", action="screenshot", target=f"responsive_{vp['name']}"),
-            ])
-
         return TestScenario(
             name="Responsive Design Test",
             description=f"Test responsive layout at {url}",
@@ -378,10 +555,10 @@ class ScenarioTemplates:
             description=f"Basic accessibility checks for {url}",
             tags=["accessibility", "a11y"],
             steps=[
-                TestStep(name="Navigate", action="navigate", target=url, critical=True),
-                TestStep(name="Check for Images with Alt", action="assert_element", target="img[alt]"),
-                TestStep(name="Check for Form Labels", action="assert_element", target="label"),
-                TestStep(name="Check for Headings", action="assert_element", target="h1"),
-                TestStep(name="Screenshot", action="screenshot", target="accessibility"),
+                TestStep("Navigate", "navigate", url, critical=True),
+                TestStep.fast("Check for Images with Alt", "assert_element", "img[alt]"),
+                TestStep.fast("Check for Form Labels", "assert_element", "label"),
+                TestStep.fast("Check for Headings", "assert_element", "h1"),
+                TestStep.fast("Screenshot", "screenshot", "accessibility"),
             ]
         )
@@ -0,0 +1,44 @@
+"""Tests for the assertion library."""
+
+import pytest
+
+from qa_agent.assertions import Assertions
+
+
+@pytest.mark.parametrize("url", [
+    "http://example.com",
+    "https://example.com/",
+    "https://sub.example.co.uk/path?q=1",
+    "HTTP://EXAMPLE.COM.",
+    "http://localhost:8080/api",
+    "http://192.168.0.1?x",
+])
+def test_is_valid_url_accepts(url):
+    assert Assertions().is_valid_url(url)
+
+
+# The old regex accepted these: \d and re.IGNORECASE matched non-ASCII
+# digits and case-folded letters, and $ matched before a trailing newline.
+@pytest.mark.parametrize("url", [
+    "http://ı.com",           # dotless i, folds to I
+    "http://ſ.com",           # long s, folds to S
+    "http://K.com",           # Kelvin sign, folds to k
+    "http://1.2.3.4٣",        # Arabic-Indic digit three
+    "http://example.com:8٠",  # Arabic-Indic digit zero in the port
+    "http://example.com\n",
+    "https://example.com/path\n",
+])
+def test_is_valid_url_rejects_non_ascii_and_trailing_newline(url):
+    assert not Assertions().is_valid_url(url)
+
+
+@pytest.mark.parametrize("url", [
+    "ftp://example.com",
+    "http://",
+    "http://example",
+    "http://-bad.com",
+    "http://example.com:port",
+    "http://example.com/with space",
+])
+def test_is_valid_url_rejects(url):
+    assert not Assertions().is_valid_url(url)
@@ -0,0 +1,103 @@
+"""Tests for scenario data structures and scenario-file loading."""
+
+import json
+
+import pytest
+
+from qa_agent import scenarios
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+needs_msgspec = pytest.mark.skipif(msgspec is None, reason="msgspec not installed")
+
+
+def test_step_counts_follow_status_changes():
+    step = scenarios.TestStep("Click", "click", "#go")
+    result = scenarios.TestResult(
+        scenario=scenarios.TestScenario("s"),
+        step_results=[
+            scenarios.StepResult(step, status="passed"),
+            scenarios.StepResult(step, status="failed"),
+        ],
+    )
+    assert (result.passed_steps, result.failed_steps) == (1, 1)
+
+    result.step_results[1].status = "passed"
+    assert (result.passed_steps, result.failed_steps) == (2, 0)
+
+    result.step_results = [scenarios.StepResult(step, status="failed")] * 2
+    assert (result.passed_steps, result.failed_steps) == (0, 2)
+    assert result.to_dict()["failed_steps"] == 2
+
+
+def test_filter_by_tag_sees_later_changes():
+    suite = scenarios.TestSuite("Suite")
+    first = scenarios.TestScenario("first")
+    suite.add_scenario(first)
+    assert suite.filter_by_tag("smoke") == []
+
+    first.add_tag("smoke")
+    assert suite.filter_by_tag("smoke") == [first]
+
+    second = scenarios.TestScenario("second", tags=["smoke"])
+    suite.scenarios.append(second)
+    assert suite.filter_by_tag("smoke") == [first, second]
+
+    suite.scenarios = [second]
+    assert suite.filter_by_tag("smoke") == [second]
+
+
+def test_template_scenarios_do_not_share_steps():
+    first = scenarios.ScenarioTemplates.accessibility_check("https://example.com")
+    second = scenarios.ScenarioTemplates.accessibility_check("https://example.com")
+
+    first.steps[1].timeout = 500
+    assert second.steps[1].timeout is None
+    assert all(a is not b for a, b in zip(first.steps, second.steps))
+
+
+def _suite_file() -> bytes:
+    login = scenarios.ScenarioTemplates.login_test(
+        "https://example.com/login", "#user", "#pass", "#submit", "alice", "secret", "Welcome"
+    ).to_dict()
+    login["timeout"] = 60000
+    login["data"] = {"users": ["alice", "bob"]}
+    page = scenarios.ScenarioTemplates.page_load_test("https://example.com", ["header", "footer"]).to_dict()
+    return json.dumps({
+        "name": "Smoke",
+        "description": "Smoke suite",
+        "scenarios": [login, page],
+    }).encode()
+
+
+@needs_msgspec
+def test_typed_and_dict_loaders_agree():
+    raw = _suite_file()
+
+    typed = scenarios.TestSuite.from_json(raw)
+    fallback = scenarios.TestSuite._from_file_data(json.loads(raw))
+
+    assert typed == fallback
+    assert typed.scenarios[0].timeout == 60000
+    assert typed.scenarios[0].data == {"users": ["alice", "bob"]}
+
+
+@needs_msgspec
+def test_msgpack_file_loads_like_json():
+    raw = _suite_file()
+    packed = msgspec.msgpack.encode(json.loads(raw))
+
+    assert scenarios.TestSuite.from_msgpack(packed) == scenarios.TestSuite.from_json(raw)
+
+
+@needs_msgspec
+def test_unknown_step_key_rejected_by_both_loaders():
+    raw = b'{"name": "n", "steps": [{"name": "a", "action": "click", "bogus": 1}]}'
+
+    with pytest.raises(TypeError):
+        scenarios.TestSuite.from_json(raw)
+    with pytest.raises(TypeError):
+        scenarios.TestSuite._from_file_data(json.loads(raw))
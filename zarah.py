@@ -14,10 +14,14 @@ Usage:
 
 import asyncio
 import argparse
-import json
 import sys
 from pathlib import Path
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -42,9 +46,13 @@ BANNER = """
 """
 
 
+# Banner wrapped in its ANSI color codes once, at import
+_BANNER_COLORED = "\033[95m" + BANNER + "\033[0m"
+
+
 def print_banner():
     """Print the Zarah banner."""
-    print("\033[95m" + BANNER + "\033[0m")
+    print(_BANNER_COLORED)
 
 
 async def quick_test(url: str, expected_text: str = None, screenshot: bool = True):
@@ -101,22 +109,12 @@ async def run_scenario_file(filepath: str):
     print_banner()
     print(f"\n📁 Loading scenario from: {filepath}\n")
 
-    with open(filepath) as f:
-        data = json.load(f)
-
-    # Support both single scenario and suite format
-    if "scenarios" in data:
-        suite = TestSuite(
-            name=data.get("name", "Test Suite"),
-            description=data.get("description", ""),
-            scenarios=[TestScenario.from_dict(s) for s in data["scenarios"]]
-        )
+    # Handles both single scenario and suite format
+    path = Path(filepath)
+    if path.suffix == ".msgpack":
+        suite = TestSuite.from_msgpack(path.read_bytes())
     else:
-        scenario = TestScenario.from_dict(data)
-        suite = TestSuite(
-            name=scenario.name,
-            scenarios=[scenario]
-        )
+        suite = TestSuite.from_json(path.read_bytes())
 
     agent = QATestingAgent()
     results = await agent.run_suite(suite)
@@ -197,6 +195,83 @@ async def run_demo():
     return failed == 0
 
 
+async def _cmd_navigate(agent: QATestingAgent, parts: list[str]):
+    """Navigate to a URL."""
+    result = await agent.navigate(parts[1])
+    if result.success:
+        print(f"✓ Navigated to {parts[1]}")
+    else:
+        print(f"✗ Failed: {result.error or 'Unknown error'}")
+
+
+async def _cmd_click(agent: QATestingAgent, parts: list[str]):
+    """Click an element."""
+    result = await agent.click(parts[1])
+    print(f"✓ Clicked {parts[1]}" if result.success else f"✗ Failed to click")
+
+
+async def _cmd_type(agent: QATestingAgent, parts: list[str]):
+    """Type text into a field."""
+    result = await agent.type_text(parts[1], parts[2])
+    print(f"✓ Typed text" if result.success else f"✗ Failed to type")
+
+
+async def _cmd_screenshot(agent: QATestingAgent, parts: list[str]):
+    """Take a screenshot."""
+    name = parts[1] if len(parts) > 1 else "interactive"
+    filepath = await agent.screenshot(name)
+    print(f"✓ Screenshot saved: {filepath}" if filepath else "✗ Failed")
+
+
+async def _cmd_content(agent: QATestingAgent, parts: list[str]):
+    """Print the page content."""
+    content = await agent.get_content()
+    print(f"\n{content[:1000]}...\n" if len(content) > 1000 else f"\n{content}\n")
+
+
+async def _cmd_assert(agent: QATestingAgent, text: str):
+    """Assert text is present on the page."""
+    result = await agent.assert_text_present(text)
+    print(f"✓ Text found: {text}" if result else f"✗ Text not found: {text}")
+
+
+async def _cmd_wait(agent: QATestingAgent, parts: list[str]):
+    """Wait a number of milliseconds."""
+    ms = int(parts[1]) if len(parts) > 1 else 1000
+    await agent.wait(timeout=ms)
+    print(f"✓ Waited {ms}ms")
+
+
+async def _cmd_scroll(agent: QATestingAgent, parts: list[str]):
+    """Scroll the page up or down."""
+    direction = parts[1].lower()
+    if direction in ("up", "down"):
+        await agent.scroll(direction)
+        print(f"✓ Scrolled {direction}")
+    else:
+        print("Use: scroll up|down")
+
+
+async def _cmd_close(agent: QATestingAgent, parts: list[str]):
+    """Close the browser."""
+    await agent.close()
+    print("✓ Browser closed")
+
+
+# Interactive command -> (minimum number of parts incl. the command, handler);
+# "assert" is handled in the loop since it takes the raw rest of the line
+INTERACTIVE_COMMANDS = {
+    "navigate": (2, _cmd_navigate),
+    "click": (2, _cmd_click),
+    "type": (3, _cmd_type),
+    "screenshot": (1, _cmd_screenshot),
+    "content": (1, _cmd_content),
+    "wait": (1, _cmd_wait),
+    "scroll": (2, _cmd_scroll),
+    "close": (1, _cmd_close),
+}
+
+
 async def interactive_mode():
     """Run Zarah in interactive mode."""
     print_banner()
@@ -235,54 +310,17 @@ async def interactive_mode():
             elif action == "help":
                 print("Commands: navigate, click, type, screenshot, content, assert, wait, scroll, close, quit")
 
-            elif action == "navigate" and len(parts) > 1:
-                result = await agent.navigate(parts[1])
-                if result["success"]:
-                    print(f"✓ Navigated to {parts[1]}")
-                else:
-                    print(f"✗ Failed: {result.get('error', 'Unknown error')}")
-
-            elif action == "click" and len(parts) > 1:
-                result = await agent.click(parts[1])
-                print(f"✓ Clicked {parts[1]}" if result["success"] else f"✗ Failed to click")
-
-            elif action == "type" and len(parts) > 2:
-                result = await agent.type_text(parts[1], parts[2])
-                print(f"✓ Typed text" if result["success"] else f"✗ Failed to type")
-
-            elif action == "screenshot":
-                name = parts[1] if len(parts) > 1 else "interactive"
-                filepath = await agent.screenshot(name)
-                print(f"✓ Screenshot saved: {filepath}" if filepath else "✗ Failed")
-
-            elif action == "content":
-                content = await agent.get_content()
-                print(f"\n{content[:1000]}...\n" if len(content) > 1000 else f"\n{content}\n")
-
             elif action == "assert" and len(parts) > 1:
-                text = " ".join(parts[1:])
-                result = await agent.assert_text_present(text)
-                print(f"✓ Text found: {text}" if result else f"✗ Text not found: {text}")
-
-            elif action == "wait":
-                ms = int(parts[1]) if len(parts) > 1 else 1000
-                await agent.wait(timeout=ms)
-                print(f"✓ Waited {ms}ms")
-
-            elif action == "scroll" and len(parts) > 1:
-                direction = parts[1].lower()
-                if direction in ("up", "down"):
-                    await agent.scroll(direction)
-                    print(f"✓ Scrolled {direction}")
-                else:
-                    print("Use: scroll up|down")
-
-            elif action == "close":
-                await agent.close()
-                print("✓ Browser closed")
+                # Everything after the command, with its spacing intact
+                await _cmd_assert(agent, cmd.split(maxsplit=1)[1])
 
             else:
-                print(f"Unknown command: {action}. Type 'help' for commands.")
+                # Commands that are missing their arguments count as unknown
+                entry = INTERACTIVE_COMMANDS.get(action)
+                if entry is None or len(parts) < entry[0]:
+                    print(f"Unknown command: {action}. Type 'help' for commands.")
+                else:
+                    await entry[1](agent, parts)
 
         except KeyboardInterrupt:
             print("\n👋 Interrupted. Goodbye!")
@@ -297,8 +335,7 @@ async def run_form_test(url: str, config_file: str = None):
     print_banner()
 
     if config_file:
-        with open(config_file) as f:
-            config = json.load(f)
+        config = json_loads(Path(config_file).read_bytes())
     else:
         # Default form test config
         config = {